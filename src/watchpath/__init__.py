@@ -6,6 +6,7 @@ from .parser import (
     Session,
     SessionStatistics,
     LogRecord,
+    build_global_payload,
     build_session_chunk,
     build_session_payload,
     chunk_log_file,
@@ -24,6 +25,7 @@ __all__ = [
     "SessionAnalysis",
     "SessionStatistics",
     "LogRecord",
+    "build_global_payload",
     "build_session_chunk",
     "build_session_payload",
     "chunk_log_file",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+import shutil
 import subprocess
 from collections import Counter, defaultdict
 from dataclasses import dataclass
@@ -26,44 +27,76 @@ class SessionAnalysis:
     raw_response: str
 
 
-    
+class OllamaUnavailableError(RuntimeError):
+    """Raised when the Ollama executable cannot be launched at all."""
+
 
 # ╭──────────────────────────────────────────────────────────────╮
 # │ Model invocation                                              │
 # ╰──────────────────────────────────────────────────────────────╯
 
 
+# Everything up to the session-specific suffix must stay byte-identical
+# between calls so the model server can reuse its cached prompt prefix.
+_TASK_INSTRUCTIONS = (
+    "\n\n### TASK ###\n"
+    "Provide an anomaly score between 0 and 1, capture structured analyst "
+    "context, and highlight supporting evidence. Respond with JSON "
+    "containing `anomaly_score`, an `analyst_note` object with summary, "
+    "impact, action, confidence, and an `evidence` array of objects with "
+    "`log_excerpt` and `reason`.\n"
+)
+
+
+# Resolved once per process: every session analysis spawns the CLI, and a
+# PATH search per spawn adds up over a large log.
+_ollama_path: str | None = None
+
+
+def _ollama_executable() -> str:
+    global _ollama_path
+    if _ollama_path is None:
+        # Only a successful lookup is remembered, so installing Ollama while
+        # the app is open still works; a bare name lets ``subprocess`` report
+        # the missing executable as before.
+        _ollama_path = shutil.which("ollama")
+    return _ollama_path or "ollama"
+
+
 def analyze_logs_ollama_chunk(
     session_id: str,
     log_chunk: str,
     prompt_path: str,
     model: str = "mistral:7b-instruct",
+    *,
+    prompt_text: str | None = None,
 ) -> SessionAnalysis:
-    """Analyze a chunk of session logs using an Ollama model."""
+    """Analyze a chunk of session logs using an Ollama model.
+
+    ``prompt_text`` lets callers that analyse many sessions read the template
+    once; when omitted it is loaded from ``prompt_path``.
+    """
 
-    base_prompt = Path(prompt_path).read_text()
+    base_prompt = prompt_text if prompt_text is not None else Path(prompt_path).read_text()
     full_prompt = (
-        f"{base_prompt}\n\n### TASK ###\n"
+        f"{base_prompt}{_TASK_INSTRUCTIONS}"
         f"Session ID: {session_id}\n"
-        "Provide an anomaly score between 0 and 1, capture structured analyst "
-        "context, and highlight supporting evidence. Respond with JSON "
-        "containing `anomaly_score`, an `analyst_note` object with summary, "
-        "impact, action, confidence, and an `evidence` array of objects with "
-        "`log_excerpt` and `reason`.\n"
         "Logs:\n"
         f"{log_chunk}\n"
     )
 
     try:
         result = subprocess.run(
-            ["ollama", "run", model],
+            [_ollama_executable(), "run", model],
             input=full_prompt.encode("utf-8"),
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=False,
         )
     except FileNotFoundError as exc:  # pragma: no cover - depends on runtime environment
-        raise RuntimeError("Ollama executable not found. Install Ollama to enable analysis.") from exc
+        raise OllamaUnavailableError(
+            "Ollama executable not found. Install Ollama to enable analysis."
+        ) from exc
 
     if result.returncode != 0:
         raise RuntimeError(f"Ollama failed: {result.stderr.decode()}")
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from .ai import analyze_logs_ollama_chunk
 from .parser import (
+    build_global_payload,
     build_session_chunk,
     build_session_payload,
     format_session_markdown,
@@ -72,12 +73,14 @@ def parse_logs(request: ParseRequest) -> dict[str, Any]:
         "mean_session_duration_seconds": stats.mean_session_duration,
         "ip_distribution": stats.ip_distribution,
         "request_counts": stats.request_counts,
-        "top_ips": sorted(stats.ip_distribution.items(), key=lambda item: item[1], reverse=True)[:3],
+        "top_ips": stats.top_ips,
     }
 
     if not sessions:
         return {"sessions": [], "global_stats": global_stats}
 
+    # Every session payload shares one copy of the run-wide statistics.
+    global_payload = build_global_payload(stats)
     responses = []
     for session in sessions:
         chunk_text = build_session_chunk(session, request.chunk_size)
@@ -88,13 +91,13 @@ def parse_logs(request: ParseRequest) -> dict[str, Any]:
             model=request.model,
         )
 
-        payload = build_session_payload(session, analysis, stats)
+        payload = build_session_payload(session, analysis, stats, global_payload=global_payload)
         formats: dict[str, str] = {}
         if request.include_text:
             # Keep parity with CLI/GUI output formats for downstream consumers.
-            formats["text"] = format_session_report(session, analysis, stats)
+            formats["text"] = format_session_report(session, analysis, stats, payload=payload)
         if request.include_markdown:
-            formats["markdown"] = format_session_markdown(session, analysis, stats)
+            formats["markdown"] = format_session_markdown(session, analysis, stats, payload=payload)
         if formats:
             payload["formats"] = formats
 
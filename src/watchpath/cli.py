@@ -11,6 +11,7 @@ from typing import Sequence
 
 from .ai import analyze_logs_ollama_chunk
 from .parser import (
+    build_global_payload,
     build_session_chunk,
     build_session_payload,
     format_session_markdown,
@@ -136,6 +137,8 @@ def _handle_parse_command(args: argparse.Namespace) -> int:
     if not prompt_path.exists():
         raise FileNotFoundError(f"Prompt template not found: {prompt_path}")
 
+    prompt_text = prompt_path.read_text()
+
     sessions = load_sessions(str(log_path))
     if not sessions:
         print("No sessions found in log.")
@@ -144,6 +147,8 @@ def _handle_parse_command(args: argparse.Namespace) -> int:
     sessions = sessions[:DEFAULT_SESSION_LIMIT]
 
     stats = summarize_sessions(sessions)
+    # Identical for every session, so every report shares a single copy.
+    global_payload = build_global_payload(stats)
 
     total_sessions = len(sessions)
 
@@ -164,18 +169,23 @@ def _handle_parse_command(args: argparse.Namespace) -> int:
             log_chunk=chunk_text,
             prompt_path=str(prompt_path),
             model=args.model,
+            prompt_text=prompt_text,
         )
-        payload = build_session_payload(session, analysis, stats)
+        payload = build_session_payload(session, analysis, stats, global_payload=global_payload)
 
         if args.output_format == "json":
             json_reports.append(payload)
         elif args.output_format == "markdown":
-            rendered_reports.append(format_session_markdown(session, analysis, stats))
+            rendered_reports.append(
+                format_session_markdown(session, analysis, stats, payload=payload)
+            )
         else:
             if getattr(args, "use_rich", False):
                 rich_payloads.append(payload)
             else:
-                rendered_reports.append(format_session_report(session, analysis, stats))
+                rendered_reports.append(
+                    format_session_report(session, analysis, stats, payload=payload)
+                )
 
         if getattr(args, "confirm_each_session", False):
             if not _prompt_to_continue():
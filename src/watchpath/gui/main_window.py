@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import hashlib
+import heapq
+import json
+import sqlite3
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
-
-from PySide6.QtCore import QObject, Qt, QThread, Signal, QDateTime, QTimer
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QStandardPaths,
+    Qt,
+    QThreadPool,
+    Signal,
+    QDateTime,
+    QTimer,
+    QTimeZone,
+)
 from PySide6.QtWidgets import (
     QApplication,
+    QCheckBox,
     QComboBox,
     QDateTimeEdit,
     QDialog,
@@ -34,10 +55,11 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 
-from ..ai import SessionAnalysis, analyze_logs_ollama_chunk
+from ..ai import OllamaUnavailableError, SessionAnalysis, analyze_logs_ollama_chunk
 from ..parser import (
     Session,
     SessionStatistics,
+    build_global_payload,
     build_session_chunk,
     build_session_payload,
     format_session_markdown,
@@ -53,8 +75,220 @@ from ..ui import GlobalStatsWidget, PromptManagerPanel, SessionDetailWidget, Ses
 
 DEFAULT_PROMPT_PATH = Path("prompts/base_prompt.txt")
 
+_LOG_FILTER = "Log files (*.log *.txt);;All files (*)"
+_PROMPT_FILTER = "Text files (*.txt);;All files (*)"
+
+# Sessions analysed concurrently; keeps the model server busy between calls.
+DEFAULT_ANALYSIS_CONCURRENCY = 4
+
+# Model answers kept in memory; the sqlite store behind it holds the rest.
+DEFAULT_ANALYSIS_CACHE_SIZE = 256
+
+# Folded into every cache key; bump whenever ``SessionAnalysis`` or the
+# enrichment applied to model answers changes so stale rows stop matching.
+_CACHE_VERSION = "2"
+# Rows pruned from the sqlite store on open: older than this, or beyond the cap.
+_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+_CACHE_MAX_ROWS = 10_000
+
+# Sort key for sessions without records so they order before everything else.
+_SESSION_SORT_FLOOR = datetime.min.replace(tzinfo=timezone.utc)
+
+# Selection editors convert through epoch milliseconds in UTC.
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
+_UTC_ZONE = QTimeZone.utc()
 
 
+def _to_epoch_ms(value: datetime) -> int:
+    # Naive timestamps are read as UTC throughout the selection dialog.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH_UTC) // _ONE_MILLISECOND
+
+
+def _overlaps_ms(session_start: int, session_end: int, start: int, end: int) -> bool:
+    return session_end >= start and session_start <= end
+
+
+# ╭──────────────────────────────────────────────────────────────╮
+# │ Theme stylesheets, rendered once per palette at import       │
+# ╰──────────────────────────────────────────────────────────────╯
+
+def _build_toolbar_style(
+    bar_bg: str, button_bg: str, button_hover: str, text_color: str, accent: str
+) -> str:
+    return (
+        "QToolBar#MochiToolbar {"
+        f" background: {bar_bg};"
+        " border: none;"
+        " padding: 6px 12px;"
+        "}"
+        "QToolBar#MochiToolbar QLabel#ToolbarLabel {"
+        f" color: {text_color};"
+        " font-weight: 600;"
+        " margin-right: 6px;"
+        "}"
+        "QToolBar#MochiToolbar QToolButton#MochiToolbarButton {"
+        f" background: {button_bg};"
+        f" color: {text_color};"
+        " border-radius: 18px;"
+        " padding: 6px 14px;"
+        " font-weight: 600;"
+        "}"
+        "QToolBar#MochiToolbar QToolButton#MochiToolbarButton:hover {"
+        f" background: {button_hover};"
+        "}"
+        "QToolBar#MochiToolbar QToolButton#MochiToolbarButton:pressed {"
+        f" background: {button_hover};"
+        " opacity: 0.9;"
+        "}"
+        "QComboBox#ThemeSelector {"
+        f" background: {button_bg};"
+        f" color: {text_color};"
+        f" border: 1px solid {accent};"
+        " border-radius: 16px;"
+        " padding: 4px 12px;"
+        " min-width: 100px;"
+        " font-weight: 600;"
+        "}"
+        "QComboBox#ThemeSelector::drop-down { border: 0px; }"
+    )
+
+
+def _build_selection_dialog_style(bg: str, text: str, accent: str, card: str) -> str:
+    return (
+        "QDialog#SessionSelectionDialog {"
+        f" background-color: {bg};"
+        " border-radius: 24px;"
+        "}"
+        "QLabel#SessionSummaryLabel, QLabel#SessionHintLabel {"
+        f" color: {text};"
+        " font-size: 16px;"
+        " font-weight: 600;"
+        "}"
+        "QTabWidget::pane {"
+        f" background: {card};"
+        " border-radius: 18px;"
+        f" border: 1px solid {accent};"
+        " padding: 12px;"
+        "}"
+        "QTabBar::tab {"
+        f" background: {card};"
+        f" color: {text};"
+        " border-radius: 16px;"
+        " padding: 8px 18px;"
+        " margin: 4px;"
+        " font-weight: 600;"
+        "}"
+        "QTabBar::tab:selected {"
+        f" background: {accent};"
+        " color: white;"
+        "}"
+        "QLabel#SelectionPreview {"
+        f" color: {text};"
+        " font-style: italic;"
+        "}"
+        "QDialogButtonBox QPushButton {"
+        f" background: {accent};"
+        " color: white;"
+        " border-radius: 16px;"
+        " padding: 8px 18px;"
+        " font-weight: 600;"
+        " min-width: 120px;"
+        "}"
+        "QDialogButtonBox QPushButton:disabled {"
+        " background: #888;"
+        " color: #eee;"
+        "}"
+    )
+
+
+def _build_app_style(
+    base_bg: str, text: str, card_bg: str, border: str, tile_bg: str, accent: str
+) -> str:
+    return (
+        "QMainWindow {"
+        f" background: {base_bg};"
+        f" color: {text};"
+        "}"
+        "QLabel {"
+        f" color: {text};"
+        "}"
+        "QFrame#SessionStatsCard {"
+        f" background-color: {card_bg};"
+        " border-radius: 22px;"
+        f" border: 1px solid {border};"
+        "}"
+        "QFrame#GlobalStats {"
+        f" background-color: {card_bg};"
+        " border-radius: 20px;"
+        f" border: 1px solid {border};"
+        "}"
+        "QFrame#MetricTile {"
+        f" background-color: {tile_bg};"
+        " border-radius: 14px;"
+        "}"
+        "QLabel.MetricTileCaption {"
+        f" color: {text};"
+        "}"
+        "QTextBrowser#AnalystNoteDisplay,"
+        " QTextBrowser#EvidenceView,"
+        " QTextBrowser#LogsView,"
+        " QTextBrowser#MarkdownView {"
+        f" background-color: {card_bg};"
+        f" color: {text};"
+        f" border: 1px solid {border};"
+        " border-radius: 18px;"
+        " padding: 12px;"
+        "}"
+        "QTabWidget::pane {"
+        f" background: {card_bg};"
+        f" border: 1px solid {border};"
+        " border-radius: 18px;"
+        " margin-top: 12px;"
+        "}"
+        "QTabWidget::tab-bar {"
+        " alignment: left;"
+        "}"
+        "QTabBar::tab {"
+        f" background: {tile_bg};"
+        f" color: {text};"
+        " border-radius: 14px;"
+        " padding: 8px 16px;"
+        " margin: 4px;"
+        " font-weight: 600;"
+        "}"
+        "QTabBar::tab:hover {"
+        f" background: {tile_bg};"
+        f" border: 1px solid {border};"
+        "}"
+        "QTabBar::tab:selected {"
+        f" background: {accent};"
+        " color: white;"
+        "}"
+    )
+
+
+_TOOLBAR_STYLES = {
+    "light": _build_toolbar_style("#f1ecff", "#ede9fe", "#e0d7fe", "#1f1b2e", "#7c3aed"),
+    "dark": _build_toolbar_style("#131d32", "#1b2536", "#243049", "#e2e8f0", "#c084fc"),
+}
+
+_APP_STYLES = {
+    "light": _build_app_style("#f8f5ff", "#1f2937", "#ffffff", "#d8ccff", "#ede9fe", "#7c3aed"),
+    "dark": _build_app_style("#0f172a", "#e2e8f0", "#1e293b", "#334155", "#1b2536", "#c084fc"),
+}
+
+_SELECTION_DIALOG_STYLES = {
+    "light": _build_selection_dialog_style(
+        "#f7f4ff", "#1f1b2e", "#7c3aed", "rgba(124, 58, 237, 0.08)"
+    ),
+    "dark": _build_selection_dialog_style(
+        "#111a2e", "#e2e8f0", "#c084fc", "rgba(15, 23, 42, 0.65)"
+    ),
+}
+
 
 # ╭──────────────────────────────────────────────────────────────╮
 # │ Worker payload container                                     │
@@ -62,13 +296,75 @@ DEFAULT_PROMPT_PATH = Path("prompts/base_prompt.txt")
 
 @dataclass
 class ProcessedSession:
-    """Payload delivered from the worker thread to the UI."""
+    """Payload delivered from the worker thread to the UI.
+
+    Reports are rendered on first access, so the worker hands results over
+    as soon as the model answers and only the views a user opens are built.
+    ``payload["global_stats"]`` is the run-wide block shared by every session.
+    The model input chunk is kept too, so prompt overrides reuse it.
+    """
+
+    # Spelled out rather than ``slots=True`` to keep Python 3.9 support.
+    __slots__ = (
+        "session",
+        "global_stats",
+        "payload",
+        "analysis",
+        "_text_report",
+        "_markdown_report",
+        "_chunk",
+    )
 
     session: Session
     global_stats: SessionStatistics
     payload: dict
-    text_report: str
-    markdown_report: str
+    analysis: SessionAnalysis
+
+    @property
+    def text_report(self) -> str:
+        try:
+            return self._text_report
+        except AttributeError:
+            self._text_report = format_session_report(
+                self.session,
+                self.analysis,
+                self.global_stats,
+                payload=self.payload,
+            )
+            return self._text_report
+
+    @property
+    def markdown_report(self) -> str:
+        try:
+            return self._markdown_report
+        except AttributeError:
+            self._markdown_report = format_session_markdown(
+                self.session,
+                self.analysis,
+                self.global_stats,
+                payload=self.payload,
+            )
+            return self._markdown_report
+
+    def reuse_reports(self, previous: ProcessedSession) -> None:
+        """Adopt reports ``previous`` already rendered for the same inputs."""
+
+        for name in ("_text_report", "_markdown_report"):
+            try:
+                setattr(self, name, getattr(previous, name))
+            except AttributeError:
+                pass
+
+    def chunk_text(self, chunk_size: int) -> str:
+        try:
+            size, text = self._chunk
+            if size == chunk_size:
+                return text
+        except AttributeError:
+            pass
+        text = build_session_chunk(self.session, chunk_size)
+        self._chunk = (chunk_size, text)
+        return text
 
 
 class AnalysisWorker(QObject):
@@ -79,11 +375,20 @@ class AnalysisWorker(QObject):
     # ╰──────────────────────────────────────────────────────────╯
     status = Signal(str)
     error = Signal(str)
-    progress = Signal(int, int)
-    global_stats_ready = Signal(dict)
-    session_ready = Signal(ProcessedSession)
+    # A read-only mapping shared with every session payload of the run.
+    global_stats_ready = Signal(object)
+    # Processed sessions, progress (index, total) and the status line are
+    # fused into one queued emission so the GUI wakes once per flush.
+    batch_ready = Signal(list, int, int, str)
     finished = Signal()
 
+    batch_size = 8
+    # Minimum gap between flushes; keeps status/progress repaints well under
+    # the display refresh rate on fast runs.
+    batch_interval_ns = 100_000_000
+    # How often a wait on an in-flight model call wakes to check for Stop.
+    stop_poll_interval = 0.1
+
     def __init__(
         self,
         log_path: Path,
@@ -93,15 +398,36 @@ class AnalysisWorker(QObject):
         prompt_path: Path,
         selection_summary: str | None = None,
         sessions: list[Session] | None = None,
+        max_workers: int = DEFAULT_ANALYSIS_CONCURRENCY,
+        cache: AnalysisCache | None = None,
+        read_cache: bool = True,
     ) -> None:
         super().__init__()
         self.log_path = log_path
         self.chunk_size = max(1, chunk_size)
         self.model = model
         self.prompt_path = prompt_path
-        self._provided_sessions = list(sessions) if sessions is not None else None
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        # Off forces a fresh model call; the new answer still refreshes the cache.
+        self.read_cache = read_cache
+        self._prompt_text: str | None = None
+        # Set once Ollama proves missing so remaining sessions skip the launch.
+        self._ollama_down: OllamaUnavailableError | None = None
+        # Constant for the whole run, so computed once rather than per session.
+        self._prompt_path_str = str(prompt_path)
+        self._run_meta = {
+            "chunk_size": self.chunk_size,
+            "model": self.model,
+            "prompt_path": self._prompt_path_str,
+        }
+        # Held by reference: the window parsed these for the selection dialog
+        # and hands ownership over, so the worker never re-reads the log.
+        self._provided_sessions = sessions
         self._selection_summary = selection_summary
         self._should_stop = False
+        self._batch: list[ProcessedSession] = []
+        self._last_flush_ns = 0
 
     def run(self) -> None:  # pragma: no cover - requires Qt event loop
         try:
@@ -109,10 +435,11 @@ class AnalysisWorker(QObject):
                 raise FileNotFoundError(f"Log file not found: {self.log_path}")
             if not self.prompt_path.exists():
                 raise FileNotFoundError(f"Prompt template not found: {self.prompt_path}")
+            self._prompt_text = self.prompt_path.read_text()
 
             self.status.emit("🌸 Preparing tea and parsing sessions…")
             if self._provided_sessions is not None:
-                sessions = list(self._provided_sessions)
+                sessions = self._provided_sessions
                 self._provided_sessions = None
             else:
                 sessions = load_sessions(str(self.log_path))
@@ -126,19 +453,41 @@ class AnalysisWorker(QObject):
             # │ Global context generation │
             # ╰───────────────────────────╯
             stats = summarize_sessions(sessions)
-            self.global_stats_ready.emit(self._build_global_payload(stats))
+            global_payload = MappingProxyType(build_global_payload(stats))
+            self.global_stats_ready.emit(global_payload)
 
             total = len(sessions)
-            for index, session in enumerate(sessions, start=1):
-                # Gracefully honour stop requests while still completing the
-                # current session to keep the UI consistent.
-                if self._should_stop:
-                    break
-                self.progress.emit(index, total)
-                self.status.emit(
-                    f"🍡 Whispering with session {session.session_id} ({index}/{total})…"
-                )
-                self.session_ready.emit(self._process_session(session, stats))
+            completed = 0
+            # Keep several model calls in flight, but collect results in
+            # submission order so the session list stays chronological.
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            try:
+                futures = [
+                    executor.submit(self._process_session, session, stats, global_payload)
+                    for session in sessions
+                ]
+                for index, (session, future) in enumerate(zip(sessions, futures), start=1):
+                    # Stop requests are honoured straight away: queued calls are
+                    # cancelled and running ones finish in the background with
+                    # their results discarded.
+                    if self._should_stop:
+                        break
+                    self._queue_progress(
+                        index,
+                        total,
+                        f"🍡 Whispering with session {session.session_id} ({index}/{total})…",
+                    )
+                    processed = self._await_result(future, index, total)
+                    if processed is None:
+                        break
+                    self._batch.append(processed)
+                    completed = index
+            finally:
+                # Never waits: on Stop (or a window close) queued sessions are
+                # cancelled and running calls are abandoned, so the pool
+                # thread driving this run is released straight away.
+                executor.shutdown(wait=False, cancel_futures=True)
+            self._flush_batch(completed, total, "")
 
             if self._should_stop:
                 self.status.emit("⏹️ Session analysis stopped. Showing collected results so far.")
@@ -152,66 +501,378 @@ class AnalysisWorker(QObject):
     def request_stop(self) -> None:
         self._should_stop = True
 
-    def _build_global_payload(self, stats: SessionStatistics) -> dict:
-        top_ips = sorted(
-            stats.ip_distribution.items(), key=lambda item: item[1], reverse=True
-        )[:3]
-        return {
-            "mean_session_duration_seconds": stats.mean_session_duration,
-            "ip_distribution": stats.ip_distribution,
-            "request_counts": stats.request_counts,
-            "top_ips": top_ips,
-            "status_distribution": stats.status_distribution,
-            "request_timeline": stats.request_timeline,
-        }
+    def stop_requested(self) -> bool:
+        return self._should_stop
+
+    def _await_result(
+        self, future: Future, index: int, total: int
+    ) -> ProcessedSession | None:
+        # Wait in short slices so Stop never blocks on a slow model call;
+        # anything landing after the request is dropped. Each wake-up also
+        # delivers finished sessions whose batch interval has elapsed, so
+        # they never sit out the whole of the next call.
+        while True:
+            done, _ = wait([future], timeout=self.stop_poll_interval)
+            if self._should_stop:
+                return None
+            if done:
+                return future.result()
+            if self._batch and self._flush_due():
+                self._flush_batch(index, total, "")
+
+    def _queue_progress(self, index: int, total: int, message: str) -> None:
+        # Sessions finished since the last flush ride along with the next
+        # progress update once the batch is full or the interval elapsed.
+        # The last session's status always goes out so the line never lags.
+        if self._flush_due() or index == total or len(self._batch) >= self.batch_size:
+            self._flush_batch(index, total, message)
+
+    def _flush_due(self) -> bool:
+        return time.monotonic_ns() - self._last_flush_ns >= self.batch_interval_ns
+
+    def _flush_batch(self, index: int, total: int, message: str) -> None:
+        batch, self._batch = self._batch, []
+        self._last_flush_ns = time.monotonic_ns()
+        self.batch_ready.emit(batch, index, total, message)
 
     # ╭──────────────────────────────────────────────────────────╮
     # │ Session payload assembly                                 │
     # ╰──────────────────────────────────────────────────────────╯
-    def _process_session(self, session: Session, stats: SessionStatistics) -> ProcessedSession:
+    def _process_session(
+        self,
+        session: Session,
+        stats: SessionStatistics,
+        global_payload: Mapping[str, object],
+    ) -> ProcessedSession:
         chunk_text = build_session_chunk(session, self.chunk_size)
-        try:
-            analysis = analyze_logs_ollama_chunk(
-                session_id=session.session_id,
-                log_chunk=chunk_text,
-                prompt_path=str(self.prompt_path),
-                model=self.model,
+        cache_key = None
+        analysis = None
+        if self.cache is not None:
+            cache_key = AnalysisCache.key_for(
+                session.session_id, self._prompt_text, self.model, self.chunk_size, chunk_text
             )
+            if self.read_cache:
+                analysis = self.cache.get(cache_key)
+        try:
+            if analysis is None:
+                if self._ollama_down is not None:
+                    raise self._ollama_down
+                analysis = analyze_logs_ollama_chunk(
+                    session_id=session.session_id,
+                    log_chunk=chunk_text,
+                    prompt_path=self._prompt_path_str,
+                    model=self.model,
+                    prompt_text=self._prompt_text,
+                )
+                if cache_key is not None and _is_cacheable(analysis):
+                    self.cache.put(cache_key, analysis)
         except Exception as exc:  # pragma: no cover - UI feedback path
+            if isinstance(exc, OllamaUnavailableError):
+                self._ollama_down = exc
             # When the model call fails we still surface something actionable
-            # by replaying the raw logs to the analyst as evidence.
-            fallback_evidence = "\n".join(record.raw for record in session.records[: self.chunk_size])
+            # by replaying the raw logs to the analyst as evidence; that is
+            # exactly the chunk already built for the model.
             analysis = SessionAnalysis(
                 session_id=session.session_id,
                 anomaly_score=None,
                 analyst_note=f"Analysis unavailable: {exc}",
-                evidence=fallback_evidence or "No evidence captured.",
+                evidence=chunk_text or "No evidence captured.",
                 raw_response=str(exc),
             )
 
-        payload = build_session_payload(session, analysis, stats)
-        text_report = format_session_report(session, analysis, stats)
-        markdown_report = format_session_markdown(session, analysis, stats)
-        payload.update(
-            {
-                "chunk_size": self.chunk_size,
+        payload = build_session_payload(
+            session, analysis, stats, global_payload=global_payload, metadata=self._run_meta
+        )
+        processed = ProcessedSession(
+            session=session,
+            global_stats=stats,
+            payload=payload,
+            analysis=analysis,
+        )
+        processed._chunk = (self.chunk_size, chunk_text)
+        return processed
+
+
+def _log_file_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+class SessionLoadWorker(QObject):
+    """Parse a log file into sessions away from the GUI thread."""
+
+    loaded = Signal(list)
+    failed = Signal(str)
+
+    def __init__(self, log_path: Path) -> None:
+        super().__init__()
+        self.log_path = log_path
+        self.file_key: tuple[str, int, int] | None = None
+
+    def run(self) -> None:  # pragma: no cover - executed on a pool thread
+        # Taken before parsing so a write racing the parse invalidates it.
+        self.file_key = _log_file_key(self.log_path)
+        try:
+            sessions = load_sessions(str(self.log_path))
+        except Exception as exc:  # pragma: no cover - UI feedback path
+            self.failed.emit(str(exc))
+            return
+        self.loaded.emit(sessions)
+
+
+def _default_analysis_cache_path() -> Path:
+    root = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+    return Path(root or Path.home() / ".cache") / "watchpath" / "analysis_cache.sqlite3"
+
+
+def _is_cacheable(analysis: SessionAnalysis) -> bool:
+    # Empty or unparseable replies carry no score; storing them would replay
+    # a bad answer on every later run.
+    return bool(analysis.raw_response.strip()) and analysis.anomaly_score is not None
+
+
+class AnalysisCache:
+    """Thread-safe LRU of model answers, optionally backed by a sqlite file.
+
+    The in-memory LRU answers repeat lookups within a session; the sqlite
+    store keeps answers across launches so overrides are not paid for twice.
+    The store is opened (and pruned) on first use, which happens on a worker
+    thread, so constructing the cache never touches the disk.
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_ANALYSIS_CACHE_SIZE, path: Path | None = None
+    ) -> None:
+        self.maxsize = max(1, maxsize)
+        self._entries: OrderedDict[str, SessionAnalysis] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        # Cleared once the open is attempted, whether or not it succeeded.
+        self._pending_path = path
+
+    @staticmethod
+    def _open_store(path: Path) -> sqlite3.Connection | None:
+        # A cache that cannot be opened is not worth an error dialog; the
+        # window simply falls back to the in-memory LRU.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache("
+                "key TEXT PRIMARY KEY, json BLOB, created REAL)"
+            )
+            # Keep the store bounded: expire old answers, then trim to the
+            # newest rows. Unreachable keys from older versions age out too.
+            db.execute(
+                "DELETE FROM analysis_cache WHERE created < ?",
+                (time.time() - _CACHE_MAX_AGE_SECONDS,),
+            )
+            db.execute(
+                "DELETE FROM analysis_cache WHERE key NOT IN ("
+                "SELECT key FROM analysis_cache ORDER BY created DESC LIMIT ?)",
+                (_CACHE_MAX_ROWS,),
+            )
+            db.commit()
+        except (OSError, sqlite3.Error):
+            return None
+        return db
+
+    @staticmethod
+    def key_for(
+        session_id: str, prompt_text: str, model: str, chunk_size: int, chunk_text: str
+    ) -> str:
+        # Keyed on the prompt's contents, not its path, so edits made in the
+        # prompt manager never replay answers from an older revision.
+        # Digests (not ``hash()``) keep keys stable across launches.
+        digest = hashlib.sha256()
+        for part in (_CACHE_VERSION, session_id, prompt_text, model, str(chunk_size), chunk_text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> SessionAnalysis | None:
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is not None:
+                self._entries.move_to_end(key)
+                return analysis
+            self._ensure_store()
+            analysis = self._load(key)
+            if analysis is not None:
+                self._remember(key, analysis)
+            return analysis
+
+    def put(self, key: str, analysis: SessionAnalysis) -> None:
+        with self._lock:
+            self._remember(key, analysis)
+            self._ensure_store()
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO analysis_cache(key, json, created) VALUES (?, ?, ?)",
+                    (key, json.dumps(asdict(analysis)), time.time()),
+                )
+                self._db.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._pending_path = None
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _ensure_store(self) -> None:
+        if self._pending_path is not None:
+            path, self._pending_path = self._pending_path, None
+            self._db = self._open_store(path)
+
+    def _remember(self, key: str, analysis: SessionAnalysis) -> None:
+        self._entries[key] = analysis
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> SessionAnalysis | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT json FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+            return SessionAnalysis(**json.loads(row[0])) if row else None
+        except (sqlite3.Error, TypeError, ValueError):
+            return None
+
+
+class PromptRerunWorker(QObject):
+    """Re-analyse one processed session with an override prompt."""
+
+    ready = Signal(object)
+
+    def __init__(
+        self,
+        processed: ProcessedSession,
+        prompt_path: Path,
+        *,
+        model: str,
+        default_chunk_size: int,
+        cache: AnalysisCache | None = None,
+        prompt_text: str | None = None,
+        read_cache: bool = True,
+    ) -> None:
+        super().__init__()
+        self.processed = processed
+        self.prompt_path = prompt_path
+        self.model = model
+        self.default_chunk_size = default_chunk_size
+        self.cache = cache
+        self.read_cache = read_cache
+        # Supplied when one override fans out to many sessions, so the
+        # template is read once rather than by every worker.
+        self.prompt_text = prompt_text
+
+    def run(self) -> None:  # pragma: no cover - executed on an executor thread
+        self.ready.emit(self._rerun())
+
+    def _rerun(self) -> ProcessedSession:
+        processed = self.processed
+        session = processed.session
+        stats = processed.global_stats
+        chunk_size = int(processed.payload.get("chunk_size", self.default_chunk_size))
+        chunk_text = processed.chunk_text(chunk_size)
+        try:
+            prompt_text = self.prompt_text
+            if prompt_text is None:
+                prompt_text = self.prompt_path.read_text()
+            cache_key = None
+            analysis = None
+            if self.cache is not None:
+                cache_key = AnalysisCache.key_for(
+                    session.session_id, prompt_text, self.model, chunk_size, chunk_text
+                )
+                if self.read_cache:
+                    analysis = self.cache.get(cache_key)
+            if analysis is None:
+                analysis = analyze_logs_ollama_chunk(
+                    session_id=session.session_id,
+                    log_chunk=chunk_text,
+                    prompt_path=str(self.prompt_path),
+                    model=self.model,
+                    prompt_text=prompt_text,
+                )
+                if cache_key is not None and _is_cacheable(analysis):
+                    self.cache.put(cache_key, analysis)
+        except Exception as exc:
+            analysis = SessionAnalysis(
+                session_id=session.session_id,
+                anomaly_score=None,
+                analyst_note=f"Override failed: {exc}",
+                evidence=processed.payload.get("evidence"),
+                raw_response=str(exc),
+            )
+        prompt_path = str(self.prompt_path)
+        payload = build_session_payload(
+            session,
+            analysis,
+            stats,
+            global_payload=processed.payload["global_stats"],
+            metadata={
+                "chunk_size": chunk_size,
                 "model": self.model,
-                "prompt_path": str(self.prompt_path),
-            }
+                "prompt_path": prompt_path,
+                "override_prompt_path": prompt_path,
+            },
         )
-        return ProcessedSession(
+        rerun = ProcessedSession(
             session=session,
             global_stats=stats,
             payload=payload,
-            text_report=text_report,
-            markdown_report=markdown_report,
+            analysis=analysis,
         )
+        rerun._chunk = (chunk_size, chunk_text)
+        # Cached answers often match what the row already shows; the reports
+        # depend only on the session, analysis and run stats, so keep them.
+        if analysis == processed.analysis and stats is processed.global_stats:
+            rerun.reuse_reports(processed)
+        return rerun
+
+
+class WorkerRunnable(QRunnable):
+    """Thread-pool task that drives a worker's ``run`` to completion.
+
+    The worker stays on the GUI thread as the signal bridge; only ``run``
+    executes on the pool, so queued signals land on the window's slots.
+    """
+
+    def __init__(self, worker: AnalysisWorker | SessionLoadWorker) -> None:
+        super().__init__()
+        self.worker = worker
+
+    def run(self) -> None:  # pragma: no cover - executed on a pool thread
+        self.worker.run()
 
 
 class RerunDialog(QDialog):
     """Dialog for selecting alternate analysis parameters."""
 
-    def __init__(self, parent: Optional[QWidget], *, model: str, chunk_size: int, prompt: Path) -> None:
+    def __init__(
+        self,
+        parent: Optional[QWidget],
+        *,
+        model: str,
+        chunk_size: int,
+        prompt: Path,
+        concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
+        use_cache: bool = True,
+    ) -> None:
         super().__init__(parent)
         self.setWindowTitle("Re-run analysis")
         layout = QVBoxLayout(self)
@@ -226,6 +887,13 @@ class RerunDialog(QDialog):
         self.chunk_spin.setValue(chunk_size)
         form.addRow("Chunk size", self.chunk_spin)
 
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setMinimum(1)
+        self.concurrency_spin.setMaximum(16)
+        self.concurrency_spin.setValue(concurrency)
+        self.concurrency_spin.setToolTip("Sessions sent to the model at the same time.")
+        form.addRow("Parallel calls", self.concurrency_spin)
+
         self.prompt_edit = QLineEdit(str(prompt))
         prompt_row = QHBoxLayout()
         prompt_row.addWidget(self.prompt_edit)
@@ -234,6 +902,13 @@ class RerunDialog(QDialog):
         prompt_row.addWidget(browse_button)
         form.addRow("Prompt", prompt_row)
 
+        self.cache_check = QCheckBox("Use cached answers")
+        self.cache_check.setChecked(use_cache)
+        self.cache_check.setToolTip(
+            "Untick to ask the model again and refresh the stored answers."
+        )
+        form.addRow("", self.cache_check)
+
         layout.addLayout(form)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -242,15 +917,23 @@ class RerunDialog(QDialog):
         layout.addWidget(buttons)
 
     def _choose_prompt(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Select prompt", "", "Text files (*.txt)")
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select prompt",
+            "",
+            _PROMPT_FILTER,
+            options=QFileDialog.DontUseCustomDirectoryIcons,
+        )
         if path:
             self.prompt_edit.setText(path)
 
-    def values(self) -> tuple[str, int, Path]:
+    def values(self) -> tuple[str, int, Path, int, bool]:
         return (
             self.model_edit.text().strip(),
             int(self.chunk_spin.value()),
             Path(self.prompt_edit.text().strip()),
+            int(self.concurrency_spin.value()),
+            self.cache_check.isChecked(),
         )
 
 
@@ -259,42 +942,8 @@ class SessionSelectionDialog(QDialog):
 
     @staticmethod
     def _datetime_to_qdatetime(value: datetime) -> QDateTime:
-        if hasattr(QDateTime, "fromPython"):
-            return QDateTime.fromPython(value)
-        if value.tzinfo is not None:
-            value = value.astimezone(timezone.utc)
-            spec = Qt.UTC
-        else:
-            spec = Qt.LocalTime
-        return QDateTime(
-            value.year,
-            value.month,
-            value.day,
-            value.hour,
-            value.minute,
-            value.second,
-            value.microsecond // 1000,
-            spec,
-        )
-
-    @staticmethod
-    def _qdatetime_to_datetime(value: QDateTime) -> datetime:
-        if hasattr(value, "toPython"):
-            return value.toPython()
-        # ``toMSecsSinceEpoch`` is available across Qt versions and keeps timezone info
-        # via the returned epoch seconds. We normalise to UTC for consistent handling.
-        milliseconds = value.toMSecsSinceEpoch()
-        seconds, remainder = divmod(milliseconds, 1000)
-        microseconds = remainder * 1000
-        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
-            microsecond=microseconds
-        )
-
-    @staticmethod
-    def _ensure_utc(value: datetime) -> datetime:
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
+        # The editors always work in UTC and round-trip through epoch millis.
+        return QDateTime.fromMSecsSinceEpoch(_to_epoch_ms(value), _UTC_ZONE)
 
     def __init__(self, parent: Optional[QWidget], sessions: list[Session]) -> None:
         super().__init__(parent)
@@ -303,17 +952,28 @@ class SessionSelectionDialog(QDialog):
         self.setModal(True)
         self.resize(520, 420)
 
-        self._sessions = sorted(
-            sessions,
-            key=lambda session: session.start
-            or (datetime.min.replace(tzinfo=timezone.utc)),
-        )
+        # Sorting is deferred: the count tab only needs the first few sessions,
+        # so the full chronological order (and the time-window index built on
+        # top of it) is only paid for once the time tab is used.
+        self._sessions = sessions
+        self._sort_keys = [session.start or _SESSION_SORT_FLOOR for session in sessions]
+        self._sorted_cache: list[Session] | None = None
         self._selected_sessions: list[Session] = []
         self._selection_summary = ""
 
+        self._session_start_ms: list[int | None] = []
+        self._session_end_ms: list[int | None] = []
+        self._start_keys: list[int] = []
+        self._end_keys: list[int] = []
+
         total = len(self._sessions)
-        earliest = self._sessions[0].start if self._sessions else None
-        latest = self._sessions[-1].end if self._sessions else None
+        earliest = latest = None
+        if total:
+            # Mirror the stable sort: first of the smallest keys, last of the largest.
+            first = min(range(total), key=self._sort_keys.__getitem__)
+            last = max(reversed(range(total)), key=self._sort_keys.__getitem__)
+            earliest = self._sessions[first].start
+            latest = self._sessions[last].end
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -403,74 +1063,62 @@ class SessionSelectionDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        # Spinning a date field fires a change per step; the preview settles
+        # once the user pauses instead of recounting on every tick.
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self._update_time_preview)
+
         self.count_spin.valueChanged.connect(self._update_count_preview)
-        self.start_edit.dateTimeChanged.connect(self._update_time_preview)
-        self.end_edit.dateTimeChanged.connect(self._update_time_preview)
+        self.start_edit.dateTimeChanged.connect(self._preview_timer.start)
+        self.end_edit.dateTimeChanged.connect(self._preview_timer.start)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         self._update_count_preview(self.count_spin.value())
-        self._update_time_preview()
         self._apply_style(parent)
 
+    def _sorted_sessions(self) -> list[Session]:
+        if self._sorted_cache is None:
+            order = sorted(range(len(self._sessions)), key=self._sort_keys.__getitem__)
+            self._sorted_cache = [self._sessions[index] for index in order]
+            self._build_time_index(self._sorted_cache)
+        return self._sorted_cache
+
+    def _first_sessions(self, limit: int) -> list[Session]:
+        if self._sorted_cache is not None:
+            return self._sorted_cache[:limit]
+        # ``nsmallest`` is stable, matching ``sorted(...)[:limit]``.
+        order = heapq.nsmallest(limit, range(len(self._sessions)), key=self._sort_keys.__getitem__)
+        return [self._sessions[index] for index in order]
+
+    def _build_time_index(self, ordered: list[Session]) -> None:
+        # Bounds are reduced to UTC epoch millis once per session, aligned with
+        # ``ordered``; ``None`` marks sessions without records.
+        for session in ordered:
+            if session.records:
+                self._session_start_ms.append(_to_epoch_ms(session.records[0].timestamp))
+                self._session_end_ms.append(_to_epoch_ms(session.records[-1].timestamp))
+            else:
+                self._session_start_ms.append(None)
+                self._session_end_ms.append(None)
+
+        # For the live preview, starts already follow the sorted session order
+        # and ends are sorted on their own so both halves of the overlap test
+        # become binary searches.
+        self._start_keys = [value for value in self._session_start_ms if value is not None]
+        self._end_keys = sorted(value for value in self._session_end_ms if value is not None)
+
+    def _on_tab_changed(self, index: int) -> None:
+        if index == 1:
+            self._update_time_preview()
+
     def _apply_style(self, parent: Optional[QWidget]) -> None:
         theme = "dark"
-        if parent and hasattr(parent, "theme_combo"):
-            theme = parent.theme_combo.currentText()
-        if theme == "light":
-            bg = "#f7f4ff"
-            text = "#1f1b2e"
-            accent = "#7c3aed"
-            card = "rgba(124, 58, 237, 0.08)"
-        else:
-            bg = "#111a2e"
-            text = "#e2e8f0"
-            accent = "#c084fc"
-            card = "rgba(15, 23, 42, 0.65)"
-
-        self.setStyleSheet(
-            "QDialog#SessionSelectionDialog {"
-            f" background-color: {bg};"
-            " border-radius: 24px;"
-            "}"
-            "QLabel#SessionSummaryLabel, QLabel#SessionHintLabel {"
-            f" color: {text};"
-            " font-size: 16px;"
-            " font-weight: 600;"
-            "}"
-            "QTabWidget::pane {"
-            f" background: {card};"
-            " border-radius: 18px;"
-            f" border: 1px solid {accent};"
-            " padding: 12px;"
-            "}"
-            "QTabBar::tab {"
-            f" background: {card};"
-            f" color: {text};"
-            " border-radius: 16px;"
-            " padding: 8px 18px;"
-            " margin: 4px;"
-            " font-weight: 600;"
-            "}"
-            "QTabBar::tab:selected {"
-            f" background: {accent};"
-            " color: white;"
-            "}"
-            "QLabel#SelectionPreview {"
-            f" color: {text};"
-            " font-style: italic;"
-            "}" 
-            "QDialogButtonBox QPushButton {"
-            f" background: {accent};"
-            " color: white;"
-            " border-radius: 16px;"
-            " padding: 8px 18px;"
-            " font-weight: 600;"
-            " min-width: 120px;"
-            "}"
-            "QDialogButtonBox QPushButton:disabled {"
-            " background: #888;"
-            " color: #eee;"
-            "}"
-        )
+        theme_combo = getattr(parent, "theme_combo", None)
+        if theme_combo is not None:
+            theme = theme_combo.currentText()
+        self.setStyleSheet(_SELECTION_DIALOG_STYLES.get(theme, _SELECTION_DIALOG_STYLES["dark"]))
 
     def _update_count_preview(self, value: int) -> None:
         total = len(self._sessions)
@@ -496,40 +1144,27 @@ class SessionSelectionDialog(QDialog):
             self.time_preview.setText("Start time must be before end time.")
             return
 
-        start = self._qdatetime_to_datetime(start_dt)
-        end = self._qdatetime_to_datetime(end_dt)
+        start = start_dt.toMSecsSinceEpoch()
+        end = end_dt.toMSecsSinceEpoch()
+        self._sorted_sessions()
 
-        matched = [
-            session
-            for session in self._sessions
-            if self._session_overlaps(session, start, end)
-        ]
+        # A session ending before ``start`` also starts before ``end``, so the
+        # overlap count is "started by end" minus "finished before start".
+        matched = bisect_right(self._start_keys, end) - bisect_left(self._end_keys, start)
         if matched:
             message = (
-                f"This dreamy window wraps {len(matched)} session"
-                f"{'s' if len(matched) != 1 else ''}."
+                f"This dreamy window wraps {matched} session"
+                f"{'s' if matched != 1 else ''}."
             )
         else:
             message = "No sessions sparkle inside this window yet."
         self.time_preview.setText(message)
 
-    @staticmethod
-    def _session_overlaps(session: Session, start: datetime, end: datetime) -> bool:
-        if not session.records:
-            return False
-        session_start = session.start or session.records[0].timestamp
-        session_end = session.end or session.records[-1].timestamp
-        start = SessionSelectionDialog._ensure_utc(start)
-        end = SessionSelectionDialog._ensure_utc(end)
-        session_start = SessionSelectionDialog._ensure_utc(session_start)
-        session_end = SessionSelectionDialog._ensure_utc(session_end)
-        return (session_end >= start) and (session_start <= end)
-
     def _on_accept(self) -> None:
         current_tab = self.tabs.currentIndex()
         if current_tab == 0:
             limit = int(self.count_spin.value())
-            self._selected_sessions = self._sessions[:limit]
+            self._selected_sessions = self._first_sessions(limit)
             self._selection_summary = (
                 f"🧁 Inspecting {limit} session{'s' if limit != 1 else ''} out of {len(self._sessions)}."
             )
@@ -545,12 +1180,15 @@ class SessionSelectionDialog(QDialog):
             QMessageBox.warning(self, "Choose sessions", "Start time must be before end time.")
             return
 
-        start = self._qdatetime_to_datetime(start_dt)
-        end = self._qdatetime_to_datetime(end_dt)
+        start_ms = start_dt.toMSecsSinceEpoch()
+        end_ms = end_dt.toMSecsSinceEpoch()
         matches = [
             session
-            for session in self._sessions
-            if self._session_overlaps(session, start, end)
+            for session, session_start, session_end in zip(
+                self._sorted_sessions(), self._session_start_ms, self._session_end_ms
+            )
+            if session_start is not None
+            and _overlaps_ms(session_start, session_end, start_ms, end_ms)
         ]
         if not matches:
             QMessageBox.information(
@@ -560,14 +1198,19 @@ class SessionSelectionDialog(QDialog):
             )
             return
         self._selected_sessions = matches
+        # Comparisons use epoch millis, but the summary echoes the editors'
+        # own text so it reads in the same (local) time the user picked.
+        start = start_dt.toString(self.start_edit.displayFormat())
+        end = end_dt.toString(self.end_edit.displayFormat())
         self._selection_summary = (
             f"🌙 Exploring {len(matches)} session"
-            f"{'s' if len(matches) != 1 else ''} between {start:%d %b %Y %H:%M} and {end:%d %b %Y %H:%M}."
+            f"{'s' if len(matches) != 1 else ''} between {start} and {end}."
         )
         self.accept()
 
     def selected_sessions(self) -> list[Session]:
-        return list(self._selected_sessions)
+        # Handed over as-is: the dialog is discarded once accepted.
+        return self._selected_sessions
 
     def selection_summary(self) -> str:
         return self._selection_summary
@@ -592,17 +1235,36 @@ class KawaiiMainWindow(QMainWindow):
         self.resize(1400, 860)
         self.setAcceptDrops(True)
 
-        self._thread: Optional[QThread] = None
         self._worker: Optional[AnalysisWorker] = None
-
-        self._processed_sessions: list[ProcessedSession] = []
+        self._loader: Optional[SessionLoadWorker] = None
+        # Sessions of the last parsed log, keyed by (path, mtime_ns, size).
+        self._parsed_log: tuple[tuple[str, int, int], list[Session]] | None = None
+        # Prompt reruns in flight; results from anything else are stale.
+        self._rerun_workers: set[PromptRerunWorker] = set()
+        self._analysis_cache = AnalysisCache(path=_default_analysis_cache_path())
+        # Loads and analyses run on a private pool whose threads stay alive
+        # between them instead of respawning after idle gaps; the global
+        # pool's settings are left alone for everyone else.
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setExpiryTimeout(-1)
+
+        # Processed sessions live only in ``session_list``.
         self._session_overrides: dict[str, Path] = {}
         self._last_log_path: Optional[Path] = None
-        self._last_global_stats: dict = {}
+        # Resolved once: ``Path.cwd()`` can hit the filesystem on network mounts.
+        self._last_log_dir = str(Path.cwd())
+        self._last_global_stats: Mapping[str, object] = {}
 
         self._default_prompt_path = default_prompt_path or DEFAULT_PROMPT_PATH
         self._default_model = default_model
         self._default_chunk_size = default_chunk_size
+        self._analysis_concurrency = DEFAULT_ANALYSIS_CONCURRENCY
+        self._use_cached_answers = True
+        # Prompt-override reruns share one bounded executor sized from the
+        # "Parallel calls" setting: a large selection runs a few model calls
+        # at a time instead of occupying every Qt pool thread (and queueing
+        # log loads behind it). Created on first use.
+        self._rerun_executor: ThreadPoolExecutor | None = None
 
         self._prompt_manager_dialog: QDialog | None = None
         self._prompt_manager_panel: PromptManagerPanel | None = None
@@ -610,6 +1272,9 @@ class KawaiiMainWindow(QMainWindow):
 
         self._toolbar: QToolBar | None = None
         self._stop_button: QToolButton | None = None
+        self.theme_combo: QComboBox | None = None
+        # Re-applying an application stylesheet restyles every widget.
+        self._current_theme: str | None = None
 
         self._build_menus()
         self._build_toolbar()
@@ -712,86 +1377,14 @@ class KawaiiMainWindow(QMainWindow):
 
     # ------------------------------------------------------------------
     def _apply_theme(self) -> None:
-        theme = self.theme_combo.currentText() if hasattr(self, "theme_combo") else "dark"
+        theme = self.theme_combo.currentText() if self.theme_combo is not None else "dark"
         app = QApplication.instance()
         if not app:
             return
-        if theme == "light":
-            base_bg = "#f8f5ff"
-            text = "#1f2937"
-            card_bg = "#ffffff"
-            border = "#d8ccff"
-            tile_bg = "#ede9fe"
-            accent = "#7c3aed"
-        else:
-            base_bg = "#0f172a"
-            text = "#e2e8f0"
-            card_bg = "#1e293b"
-            border = "#334155"
-            tile_bg = "#1b2536"
-            accent = "#c084fc"
-
-        app.setStyleSheet(
-            "QMainWindow {"
-            f" background: {base_bg};"
-            f" color: {text};"
-            "}"
-            "QLabel {"
-            f" color: {text};"
-            "}"
-            "QFrame#SessionStatsCard {"
-            f" background-color: {card_bg};"
-            " border-radius: 22px;"
-            f" border: 1px solid {border};"
-            "}"
-            "QFrame#GlobalStats {"
-            f" background-color: {card_bg};"
-            " border-radius: 20px;"
-            f" border: 1px solid {border};"
-            "}"
-            "QFrame#MetricTile {"
-            f" background-color: {tile_bg};"
-            " border-radius: 14px;"
-            "}"
-            "QLabel.MetricTileCaption {"
-            f" color: {text};"
-            "}"
-            "QTextBrowser#AnalystNoteDisplay,"
-            " QTextBrowser#EvidenceView,"
-            " QTextBrowser#LogsView,"
-            " QTextBrowser#MarkdownView {"
-            f" background-color: {card_bg};"
-            f" color: {text};"
-            f" border: 1px solid {border};"
-            " border-radius: 18px;"
-            " padding: 12px;"
-            "}"
-            "QTabWidget::pane {"
-            f" background: {card_bg};"
-            f" border: 1px solid {border};"
-            " border-radius: 18px;"
-            " margin-top: 12px;"
-            "}"
-            "QTabWidget::tab-bar {"
-            " alignment: left;"
-            "}"
-            "QTabBar::tab {"
-            f" background: {tile_bg};"
-            f" color: {text};"
-            " border-radius: 14px;"
-            " padding: 8px 16px;"
-            " margin: 4px;"
-            " font-weight: 600;"
-            "}"
-            "QTabBar::tab:hover {"
-            f" background: {tile_bg};"
-            f" border: 1px solid {border};"
-            "}"
-            "QTabBar::tab:selected {"
-            f" background: {accent};"
-            " color: white;"
-            "}"
-        )
+        if theme == self._current_theme:
+            return
+        app.setStyleSheet(_APP_STYLES.get(theme, _APP_STYLES["dark"]))
+        self._current_theme = theme
 
         self._refresh_toolbar_theme()
 
@@ -800,75 +1393,30 @@ class KawaiiMainWindow(QMainWindow):
         if not self._toolbar:
             return
 
-        theme = self.theme_combo.currentText() if hasattr(self, "theme_combo") else "dark"
-        if theme == "light":
-            bar_bg = "#f1ecff"
-            button_bg = "#ede9fe"
-            button_hover = "#e0d7fe"
-            text_color = "#1f1b2e"
-            accent = "#7c3aed"
-        else:
-            bar_bg = "#131d32"
-            button_bg = "#1b2536"
-            button_hover = "#243049"
-            text_color = "#e2e8f0"
-            accent = "#c084fc"
-
-        toolbar_style = (
-            "QToolBar#MochiToolbar {"
-            f" background: {bar_bg};"
-            " border: none;"
-            " padding: 6px 12px;"
-            "}"
-            "QToolBar#MochiToolbar QLabel#ToolbarLabel {"
-            f" color: {text_color};"
-            " font-weight: 600;"
-            " margin-right: 6px;"
-            "}"
-            "QToolBar#MochiToolbar QToolButton#MochiToolbarButton {"
-            f" background: {button_bg};"
-            f" color: {text_color};"
-            " border-radius: 18px;"
-            " padding: 6px 14px;"
-            " font-weight: 600;"
-            "}"
-            "QToolBar#MochiToolbar QToolButton#MochiToolbarButton:hover {"
-            f" background: {button_hover};"
-            "}"
-            "QToolBar#MochiToolbar QToolButton#MochiToolbarButton:pressed {"
-            f" background: {button_hover};"
-            " opacity: 0.9;"
-            "}"
-            "QComboBox#ThemeSelector {"
-            f" background: {button_bg};"
-            f" color: {text_color};"
-            f" border: 1px solid {accent};"
-            " border-radius: 16px;"
-            " padding: 4px 12px;"
-            " min-width: 100px;"
-            " font-weight: 600;"
-            "}"
-            "QComboBox#ThemeSelector::drop-down { border: 0px; }"
-        )
-        self._toolbar.setStyleSheet(toolbar_style)
+        theme = self.theme_combo.currentText() if self.theme_combo is not None else "dark"
+        self._toolbar.setStyleSheet(_TOOLBAR_STYLES.get(theme, _TOOLBAR_STYLES["dark"]))
 
-        if hasattr(self, "theme_combo"):
+        if self.theme_combo is not None:
             self.theme_combo.setStyleSheet("")
 
     # ------------------------------------------------------------------
     def _refresh_toolbar_state(self) -> None:
         if self._stop_button is not None:
-            self._stop_button.setEnabled(self._worker is not None)
+            self._stop_button.setEnabled(
+                self._worker is not None and not self._worker.stop_requested()
+            )
 
     # ------------------------------------------------------------------
     def _choose_log_file(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Select access log",
-            "",
-            "Log files (*.log *.txt);;All files (*)",
+            self._last_log_dir,
+            _LOG_FILTER,
+            options=QFileDialog.DontUseCustomDirectoryIcons,
         )
         if path:
+            self._last_log_dir = str(Path(path).parent)
             # Present the session selection dialog once the event loop regains
             # control. Showing a modal dialog immediately after the native
             # ``QFileDialog`` closes can prevent it from appearing on some
@@ -876,42 +1424,66 @@ class KawaiiMainWindow(QMainWindow):
             QTimer.singleShot(0, lambda: self.load_log_file(Path(path)))
 
     def load_log_file(self, path: Path) -> None:
-        app = QApplication.instance()
-        cursor_active = False
-        if app is not None:
+        # Re-runs reopen the same file; reuse its sessions while it is unchanged.
+        key = _log_file_key(path)
+        if key is not None and self._parsed_log is not None and self._parsed_log[0] == key:
+            if self._loader is not None:
+                self._loader = None
+                if QApplication.instance() is not None:
+                    QApplication.restoreOverrideCursor()
+            self._show_session_selection_dialog(path, self._parsed_log[1])
+            return
+        # Parsing runs on the thread pool so the window keeps painting; only
+        # the most recent request may open the selection dialog.
+        if self._loader is None and QApplication.instance() is not None:
             QApplication.setOverrideCursor(Qt.WaitCursor)
-            cursor_active = True
+        loader = SessionLoadWorker(path)
+        loader.loaded.connect(self._on_sessions_loaded)
+        loader.failed.connect(self._on_sessions_load_failed)
+        self._loader = loader
+        self.status_label.setText(f"🍡 Parsing {path.name}…")
+        self._thread_pool.start(WorkerRunnable(loader))
+
+    def _take_current_loader(self) -> Optional[SessionLoadWorker]:
+        loader = self._loader
+        if loader is None or self.sender() is not loader:
+            return None
+        self._loader = None
+        if QApplication.instance() is not None:
+            QApplication.restoreOverrideCursor()
+        return loader
 
-        try:
-            sessions = load_sessions(str(path))
-        except Exception as exc:
-            if cursor_active:
-                QApplication.restoreOverrideCursor()
-            QMessageBox.critical(self, "Load log", str(exc))
+    def _on_sessions_loaded(self, sessions: list) -> None:
+        loader = self._take_current_loader()
+        if loader is None:
             return
-
         if not sessions:
-            if cursor_active:
-                QApplication.restoreOverrideCursor()
+            self.status_label.setText("Drop a log file to begin the adventure.")
             QMessageBox.information(
                 self,
                 "Load log",
                 "No sessions discovered in this log file. Maybe try another mochi batch?",
             )
             return
+        if loader.file_key is not None:
+            self._parsed_log = (loader.file_key, sessions)
+        self._show_session_selection_dialog(loader.log_path, sessions)
 
-        if cursor_active:
-            QApplication.restoreOverrideCursor()
-
-        self._show_session_selection_dialog(path, sessions)
+    def _on_sessions_load_failed(self, message: str) -> None:
+        if self._take_current_loader() is None:
+            return
+        self.status_label.setText("Drop a log file to begin the adventure.")
+        QMessageBox.critical(self, "Load log", message)
 
     def _show_session_selection_dialog(
         self, path: Path, sessions: list[Session]
     ) -> None:
-        if self._active_selection_dialog is not None:
-            self._active_selection_dialog.close()
-            self._active_selection_dialog.deleteLater()
+        previous = self._active_selection_dialog
+        if previous is not None:
+            # Closing emits ``finished``, which already clears the attribute.
             self._active_selection_dialog = None
+            previous.close()
+            previous.deleteLater()
 
         dialog = SessionSelectionDialog(self, sessions)
         dialog.setAttribute(Qt.WA_DeleteOnClose)
@@ -950,8 +1522,8 @@ class KawaiiMainWindow(QMainWindow):
         self._last_log_path = path
         self.session_list.clear()
         self.detail_widget.clear()
-        self._processed_sessions.clear()
         self._session_overrides.clear()
+        self._rerun_workers.clear()
         self.status_label.setText(summary)
         self._start_worker(
             log_path=path,
@@ -972,107 +1544,130 @@ class KawaiiMainWindow(QMainWindow):
         selection_summary: str | None = None,
         sessions: list[Session] | None = None,
     ) -> None:
-        self._stop_worker()
+        self._detach_worker()
         self.status_label.setText("🍡 Spinning up worker…")
+        # With the sessions known up front the bar starts determinate, so the
+        # first batch does not flip it out of the busy animation.
+        self.progress.setMaximum(len(sessions) if sessions else 0)
+        self.progress.setValue(0)
         self.progress.setVisible(True)
-        self.progress.setMaximum(0)
 
-        self._thread = QThread()
-        self._worker = AnalysisWorker(
+        worker = AnalysisWorker(
             log_path=log_path,
             chunk_size=chunk_size,
             model=model,
             prompt_path=prompt_path,
             selection_summary=selection_summary,
             sessions=sessions,
+            max_workers=self._analysis_concurrency,
+            cache=self._analysis_cache,
+            read_cache=self._use_cached_answers,
         )
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
-        self._worker.status.connect(self.status_label.setText)
-        self._worker.error.connect(self._show_error)
-        self._worker.progress.connect(self._update_progress)
-        self._worker.session_ready.connect(self._add_processed_session)
-        self._worker.global_stats_ready.connect(self._update_global_stats)
-        self._worker.finished.connect(self._on_worker_finished)
-        self._thread.start()
+        worker.status.connect(self._on_worker_status)
+        worker.error.connect(self._show_error)
+        worker.batch_ready.connect(self._on_batch_ready, Qt.QueuedConnection)
+        worker.global_stats_ready.connect(self._update_global_stats)
+        worker.finished.connect(self._on_worker_finished)
+        self._worker = worker
+        self._thread_pool.start(WorkerRunnable(worker))
         self._refresh_toolbar_state()
 
+    def _from_current_worker(self) -> bool:
+        # Detached workers keep running on the pool until their in-flight
+        # session returns; their queued signals must not touch the new run.
+        return self._worker is not None and self.sender() is self._worker
+
+    def _on_worker_status(self, message: str) -> None:
+        if self._from_current_worker():
+            self.status_label.setText(message)
+
+    def _on_batch_ready(
+        self, batch: list, index: int, total: int, message: str
+    ) -> None:
+        if not self._from_current_worker():
+            return
+        self._update_progress(index, total)
+        if message:
+            self.status_label.setText(message)
+        self._add_processed_sessions(batch)
+
     def _update_progress(self, index: int, total: int) -> None:
-        self.progress.setMaximum(total)
-        self.progress.setValue(index)
+        # The range stays fixed for a run; only touch it (and the value) when
+        # they actually move.
+        if self.progress.maximum() != total:
+            self.progress.setMaximum(total)
+        if self.progress.value() != index:
+            self.progress.setValue(index)
 
     def _on_worker_finished(self) -> None:
+        if not self._from_current_worker():
+            return
+        self._disconnect_worker(self._worker)
         self.progress.setVisible(False)
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait()
-            self._thread = None
         self._worker = None
         self._refresh_toolbar_state()
 
     def _show_error(self, message: str) -> None:
-        QMessageBox.critical(self, "Analysis error", message)
+        if self._from_current_worker():
+            QMessageBox.critical(self, "Analysis error", message)
 
     def _stop_worker(self) -> None:
+        # The worker stops waiting on in-flight calls, discards their results,
+        # flushes what it has, and ``finished`` then tidies up the UI.
         if self._worker:
             self._worker.request_stop()
-        if self._thread and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait()
+        self._refresh_toolbar_state()
+
+    def _detach_worker(self) -> None:
+        if self._worker:
+            self._worker.request_stop()
+            self._disconnect_worker(self._worker)
         self._worker = None
-        self._thread = None
         self.progress.setVisible(False)
         self._refresh_toolbar_state()
 
+    @staticmethod
+    def _disconnect_worker(worker: AnalysisWorker) -> None:
+        # Cut an abandoned worker loose so its remaining emissions are not
+        # dispatched to the window at all; the sender guards still cover
+        # anything that was already queued.
+        for signal in (
+            worker.status,
+            worker.error,
+            worker.batch_ready,
+            worker.global_stats_ready,
+            worker.finished,
+        ):
+            try:
+                signal.disconnect()
+            except (RuntimeError, TypeError):
+                pass
+
     # ------------------------------------------------------------------
-    def _update_global_stats(self, stats: dict) -> None:
+    def _update_global_stats(self, stats: Mapping[str, object]) -> None:
+        if not self._from_current_worker():
+            return
         self._last_global_stats = stats
         self.global_stats.update_stats(stats)
 
-    def _add_processed_session(self, processed: ProcessedSession) -> None:
-        self._processed_sessions.append(processed)
-        override = self._session_overrides.get(processed.session.session_id)
-        if override:
-            processed.payload["override_prompt_path"] = str(override)
-        self.session_list.add_session(processed)
-        if len(self._processed_sessions) == 1:
-            self._on_session_activated(processed)
-
-    def _refresh_session_list(self) -> None:
-        selected_id = None
-        selected = self.session_list.selected_sessions()
-        if selected:
-            first = selected[0]
-            if isinstance(first, ProcessedSession):
-                selected_id = first.session.session_id
-        filters = self.session_list.search_box.text()
-        method_idx = self.session_list.method_filter.currentIndex()
-        ip_idx = self.session_list.ip_filter.currentIndex()
-        score_idx = self.session_list.score_filter.currentIndex()
-
-        self.session_list.clear()
-        for processed in self._processed_sessions:
-            self.session_list.add_session(processed)
-        self.session_list.search_box.setText(filters)
-        self.session_list.method_filter.setCurrentIndex(min(method_idx, self.session_list.method_filter.count() - 1))
-        self.session_list.ip_filter.setCurrentIndex(min(ip_idx, self.session_list.ip_filter.count() - 1))
-        self.session_list.score_filter.setCurrentIndex(min(score_idx, self.session_list.score_filter.count() - 1))
-        if selected_id:
-            for row in range(self.session_list.list_widget.count()):
-                entry = self.session_list.list_widget.item(row).data(Qt.UserRole)
-                if entry and entry.session_id == selected_id:
-                    self.session_list.list_widget.setCurrentRow(row)
-                    break
+    def _add_processed_sessions(self, batch: list[ProcessedSession]) -> None:
+        if not batch:
+            return
+        for processed in batch:
+            override = self._session_overrides.get(processed.session.session_id)
+            if override:
+                processed.payload["override_prompt_path"] = str(override)
+        first_results = self.session_list.session_count() == 0
+        self.session_list.add_sessions(batch)
+        if first_results:
+            self._on_session_activated(batch[0])
 
     def _on_session_activated(self, processed: ProcessedSession | dict | None) -> None:
         if not processed:
             self.detail_widget.clear()
             return
         if isinstance(processed, dict):
-            for candidate in self._processed_sessions:
-                if candidate.payload["session_id"] == processed.get("session_id"):
-                    processed = candidate
-                    break
+            processed = self.session_list.find_session(processed.get("session_id")) or processed
         if isinstance(processed, ProcessedSession):
             self.detail_widget.display_session(processed)
 
@@ -1093,9 +1688,16 @@ class KawaiiMainWindow(QMainWindow):
             model=self._default_model,
             chunk_size=self._default_chunk_size,
             prompt=self._default_prompt_path,
+            concurrency=self._analysis_concurrency,
+            use_cache=self._use_cached_answers,
         )
         if dialog.exec() == QDialog.Accepted:
-            model, chunk_size, prompt_path = dialog.values()
+            model, chunk_size, prompt_path, concurrency, use_cache = dialog.values()
+            if concurrency != self._analysis_concurrency:
+                self._analysis_concurrency = concurrency
+                # Reruns already submitted finish on the old executor.
+                self._shutdown_rerun_executor(cancel_pending=False)
+            self._use_cached_answers = use_cache
             if model:
                 self._default_model = model
             if chunk_size:
@@ -1104,71 +1706,69 @@ class KawaiiMainWindow(QMainWindow):
                 self._default_prompt_path = prompt_path
             self.load_log_file(self._last_log_path)
 
-    def _rerun_session_with_prompt(self, processed: ProcessedSession, prompt_path: Path) -> ProcessedSession:
-        session = processed.session
-        stats = processed.global_stats
-        chunk_size = int(processed.payload.get("chunk_size", self._default_chunk_size))
-        chunk_text = build_session_chunk(session, chunk_size)
-        try:
-            analysis = analyze_logs_ollama_chunk(
-                session_id=session.session_id,
-                log_chunk=chunk_text,
-                prompt_path=str(prompt_path),
-                model=self._default_model,
-            )
-        except Exception as exc:
-            analysis = SessionAnalysis(
-                session_id=session.session_id,
-                anomaly_score=None,
-                analyst_note=f"Override failed: {exc}",
-                evidence=processed.payload.get("evidence"),
-                raw_response=str(exc),
-            )
-        payload = build_session_payload(session, analysis, stats)
-        payload.update(
-            {
-                "chunk_size": chunk_size,
-                "model": self._default_model,
-                "prompt_path": str(prompt_path),
-                "override_prompt_path": str(prompt_path),
-            }
-        )
-        text_report = format_session_report(session, analysis, stats)
-        markdown_report = format_session_markdown(session, analysis, stats)
-        return ProcessedSession(
-            session=session,
-            global_stats=stats,
-            payload=payload,
-            text_report=text_report,
-            markdown_report=markdown_report,
-        )
-
     def _apply_prompt_override(self, path: str) -> None:
         selected = self.session_list.selected_sessions()
         if not selected:
             QMessageBox.information(self, "Prompt override", "Select a session first.")
             return
         override_path = Path(path)
-        if not override_path.exists():
+        try:
+            prompt_text = override_path.read_text()
+        except (OSError, UnicodeDecodeError):
             QMessageBox.warning(self, "Prompt override", "Prompt file not found.")
             return
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            replacements: list[ProcessedSession] = []
-            for item in selected:
-                if isinstance(item, ProcessedSession):
-                    updated = self._rerun_session_with_prompt(item, override_path)
-                    replacements.append(updated)
-                    for index, existing in enumerate(self._processed_sessions):
-                        if existing.session.session_id == updated.session.session_id:
-                            self._processed_sessions[index] = updated
-                            break
-            if replacements:
-                self._session_overrides[replacements[-1].session.session_id] = override_path
-                self._refresh_session_list()
-                self._on_session_activated(replacements[-1])
-        finally:
-            QApplication.restoreOverrideCursor()
+        targets = [item for item in selected if isinstance(item, ProcessedSession)]
+        if not targets:
+            return
+        # Each rerun is a model call; run them on the pool and fold results
+        # back into their rows as they arrive.
+        for processed in targets:
+            worker = PromptRerunWorker(
+                processed,
+                override_path,
+                model=self._default_model,
+                default_chunk_size=self._default_chunk_size,
+                cache=self._analysis_cache,
+                prompt_text=prompt_text,
+                read_cache=self._use_cached_answers,
+            )
+            worker.ready.connect(self._on_rerun_ready)
+            self._rerun_workers.add(worker)
+            self._rerun_pool().submit(worker.run)
+        self.status_label.setText(
+            f"🍡 Re-running {len(targets)} session{'s' if len(targets) != 1 else ''} "
+            f"with {override_path.name}…"
+        )
+        if self._worker is None:
+            self.progress.setMaximum(0)
+            self.progress.setVisible(True)
+
+    def _rerun_pool(self) -> ThreadPoolExecutor:
+        if self._rerun_executor is None:
+            self._rerun_executor = ThreadPoolExecutor(
+                max_workers=self._analysis_concurrency, thread_name_prefix="watchpath-rerun"
+            )
+        return self._rerun_executor
+
+    def _shutdown_rerun_executor(self, *, cancel_pending: bool = True) -> None:
+        if self._rerun_executor is not None:
+            self._rerun_executor.shutdown(wait=False, cancel_futures=cancel_pending)
+            self._rerun_executor = None
+
+    def _on_rerun_ready(self, processed: ProcessedSession) -> None:
+        worker = self.sender()
+        if worker not in self._rerun_workers:
+            return
+        self._rerun_workers.discard(worker)
+        session_id = processed.session.session_id
+        if self.session_list.replace_sessions({session_id: processed}):
+            self._session_overrides[session_id] = worker.prompt_path
+        if self._rerun_workers:
+            return
+        if self._worker is None:
+            self.progress.setVisible(False)
+        self.status_label.setText("✨ Prompt override applied.")
+        self._on_session_activated(processed)
 
     # ------------------------------------------------------------------
     def _open_model_manager(self) -> None:
@@ -1188,13 +1788,22 @@ class KawaiiMainWindow(QMainWindow):
             layout.addWidget(buttons)
             self._prompt_manager_dialog = dialog
             self._prompt_manager_panel = panel
-        if self._prompt_manager_panel is not None:
-            self._prompt_manager_panel.reload()
+        elif self._prompt_manager_panel is not None:
+            self._prompt_manager_panel.reload_if_changed()
         self._prompt_manager_dialog.show()
         self._prompt_manager_dialog.raise_()
         self._prompt_manager_dialog.activateWindow()
 
     # ------------------------------------------------------------------
+    def closeEvent(self, event) -> None:  # pragma: no cover - Qt callback
+        # The private pool waits for its runnables when destroyed; stop the
+        # analysis and forget any pending load so closing never hangs on them.
+        self._detach_worker()
+        self._loader = None
+        self._shutdown_rerun_executor()
+        self._analysis_cache.close()
+        super().closeEvent(event)
+
     def dragEnterEvent(self, event) -> None:  # pragma: no cover - Qt callback
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
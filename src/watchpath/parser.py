@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
+import operator
 import re
 import statistics
+import sys
 from collections import Counter, defaultdict
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from .ai import SessionAnalysis
 
@@ -21,6 +24,15 @@ LOG_PATTERN = re.compile(
 )
 
 TIME_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+# Logs use a handful of offsets; share one tzinfo per offset string.
+_TIMEZONES: Dict[str, timezone] = {}
 DEFAULT_INACTIVITY_WINDOW = timedelta(minutes=15)
 
 
@@ -33,6 +45,23 @@ DEFAULT_INACTIVITY_WINDOW = timedelta(minutes=15)
 class LogRecord:
     """A parsed Apache/Nginx access log entry."""
 
+    # One instance per log line: slots drop the per-record ``__dict__``.
+    # Spelled out rather than ``slots=True`` to keep Python 3.9 support.
+    __slots__ = (
+        "ip",
+        "ident",
+        "user",
+        "timestamp",
+        "method",
+        "path",
+        "protocol",
+        "status",
+        "size",
+        "referrer",
+        "user_agent",
+        "raw",
+    )
+
     ip: str
     ident: str
     user: str
@@ -51,6 +80,8 @@ class LogRecord:
 class Session:
     """Logical collection of log records for a single visitor."""
 
+    __slots__ = ("session_id", "ip", "user", "records")
+
     session_id: str
     ip: str
     user: str
@@ -80,6 +111,16 @@ class SessionStatistics:
     request_counts: Dict[str, int]
     status_distribution: Dict[int, int]
     request_timeline: List[Tuple[str, int]]
+    # The three busiest IPs, ranked once here rather than per report.
+    top_ips: List[Tuple[str, int]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # Instances built outside ``summarize_sessions`` may omit the ranking;
+        # derive it so reports never silently lose the busiest IPs.
+        if not self.top_ips and self.ip_distribution:
+            self.top_ips = heapq.nlargest(
+                3, self.ip_distribution.items(), key=operator.itemgetter(1)
+            )
 
 
     
@@ -92,9 +133,59 @@ class SessionStatistics:
 def chunk_log_file(log_path: str, chunk_size: int = 50) -> Iterable[str]:
     """Yield raw log lines from ``log_path`` in chunks of ``chunk_size``."""
 
-    lines = Path(log_path).read_text().splitlines()
-    for index in range(0, len(lines), chunk_size):
-        yield "\n".join(lines[index : index + chunk_size])
+    # Streamed so only one chunk of the file is held at a time.
+    chunk: List[str] = []
+    with open(log_path) as handle:
+        for line in handle:
+            chunk.append(line.rstrip("\n"))
+            if len(chunk) >= chunk_size:
+                yield "\n".join(chunk)
+                chunk = []
+    if chunk:
+        yield "\n".join(chunk)
+
+
+# Busy logs repeat the same second many times; datetimes are immutable, so
+# records can share one instance per timestamp string.
+@lru_cache(maxsize=65536)
+def _parse_timestamp(time_str: str) -> datetime:
+    """Parse ``TIME_FORMAT`` timestamps, slicing the fixed-width common case.
+
+    ``strptime`` re-interprets the format on every call and dominates parse
+    time; anything that does not look like ``10/Oct/2000:13:55:36 -0700``
+    still goes through it so behaviour (and errors) stay the same.
+    """
+
+    try:
+        if (
+            len(time_str) != 26
+            or time_str[2] != "/"
+            or time_str[6] != "/"
+            or time_str[11] != ":"
+            or time_str[14] != ":"
+            or time_str[17] != ":"
+            or time_str[20] != " "
+            or not (time_str[0:2] + time_str[7:11] + time_str[12:20].replace(":", "")).isdigit()
+        ):
+            raise ValueError(time_str)
+        offset = time_str[21:]
+        tz = _TIMEZONES.get(offset)
+        if tz is None:
+            if offset[0] not in "+-" or not offset[1:].isdigit() or offset[3] > "5":
+                raise ValueError(time_str)
+            delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+            tz = _TIMEZONES.setdefault(offset, timezone(-delta if offset[0] == "-" else delta))
+        return datetime(
+            int(time_str[7:11]),
+            _MONTHS[time_str[3:6]],
+            int(time_str[0:2]),
+            int(time_str[12:14]),
+            int(time_str[15:17]),
+            int(time_str[18:20]),
+            tzinfo=tz,
+        )
+    except (KeyError, ValueError):
+        return datetime.strptime(time_str, TIME_FORMAT)
 
 
 def parse_log_line(line: str) -> Optional[LogRecord]:
@@ -107,32 +198,38 @@ def parse_log_line(line: str) -> Optional[LogRecord]:
     if not match:
         return None
 
-    time_str = match.group("time")
+    # One ``groups()`` call instead of a ``group()`` lookup per field; the
+    # order mirrors the named groups in ``LOG_PATTERN``.
+    ip, ident, user, time_str, request_line, status, size_token, referrer, agent = match.groups()
     try:
-        timestamp = datetime.strptime(time_str, TIME_FORMAT)
+        timestamp = _parse_timestamp(time_str)
     except ValueError:
         return None
 
-    request = match.group("request").split()
-    # Requests sometimes omit pieces (for example when the method is missing),
-    # so we pad the result to avoid ``IndexError`` surprises downstream.
-    method, path, protocol = (request + ["", "", ""])[:3]
+    # Only the first three tokens matter, so stop splitting after them.
+    request = request_line.split(maxsplit=3)
+    if len(request) < 3:
+        # Requests sometimes omit pieces (for example when the method is
+        # missing), so we pad the result to avoid ``IndexError`` surprises.
+        request += [""] * (3 - len(request))
+    method, path, protocol = request[0], request[1], request[2]
 
-    size_token = match.group("size")
     size = int(size_token) if size_token.isdigit() else 0
 
+    # Clients, verbs and agents repeat on most lines; interning lets every
+    # record share one string per distinct value instead of its own copy.
     return LogRecord(
-        ip=match.group("ip"),
-        ident=match.group("ident"),
-        user=match.group("user") if match.group("user") != "-" else "",
+        ip=sys.intern(ip),
+        ident=ident,
+        user=user if user != "-" else "",
         timestamp=timestamp,
-        method=method,
+        method=sys.intern(method),
         path=path,
-        protocol=protocol,
-        status=int(match.group("status")),
+        protocol=sys.intern(protocol),
+        status=int(status),
         size=size,
-        referrer=match.group("referrer"),
-        user_agent=match.group("agent"),
+        referrer=sys.intern(referrer),
+        user_agent=sys.intern(agent),
         raw=line,
     )
 
@@ -144,10 +241,18 @@ def load_sessions(
 ) -> List[Session]:
     """Parse ``log_path`` and group records into sessions."""
 
-    lines = Path(log_path).read_text().splitlines()
-    records = [parse_log_line(line) for line in lines if line.strip()]
-    records = [record for record in records if record is not None]
-    records.sort(key=lambda record: record.timestamp)
+    # Parse while reading instead of holding the whole file and a copy of
+    # it split into lines.
+    with open(log_path) as handle:
+        parsed = (parse_log_line(line.rstrip("\n")) for line in handle if line.strip())
+        records = [record for record in parsed if record is not None]
+    # Aware datetimes with different tzinfo compare through utcoffset() on
+    # both sides, which dominates the sort on mixed-offset logs; POSIX
+    # seconds order the same way and compare as plain floats.
+    if len({record.timestamp.tzinfo for record in records}) > 1:
+        records.sort(key=lambda record: record.timestamp.timestamp())
+    else:
+        records.sort(key=operator.attrgetter("timestamp"))
 
     sessions: List[Session] = []
     active_sessions: Dict[tuple[str, str], Session] = {}
@@ -156,13 +261,9 @@ def load_sessions(
     for record in records:
         key = (record.ip, record.user)
         existing = active_sessions.get(key)
-        start_new = True
-        if existing and existing.records:
-            delta = record.timestamp - existing.records[-1].timestamp
-            if delta <= inactivity_window:
-                start_new = False
-
-        if start_new:
+        # Sessions are never empty once created, so only the gap to the
+        # previous record decides whether this one starts a new session.
+        if existing is None or record.timestamp - existing.records[-1].timestamp > inactivity_window:
             counters[key] += 1
             label_user = record.user or "anon"
             session_id = f"{record.ip}-{label_user}-{counters[key]}"
@@ -171,7 +272,6 @@ def load_sessions(
             active_sessions[key] = existing
 
         existing.records.append(record)
-        active_sessions[key] = existing
 
     return sessions
 
@@ -192,13 +292,19 @@ def summarize_sessions(sessions: Iterable[Session]) -> SessionStatistics:
     request_counts: Counter[str] = Counter()
     status_counts: Counter[int] = Counter()
     timeline_counts: Counter[datetime] = Counter()
+    # Records parsed from the same second share a timestamp, so each distinct
+    # one is truncated to its minute once.
+    minutes: Dict[datetime, datetime] = {}
     for session in session_list:
         for record in session.records:
-            request_counts.update([record.method or "UNKNOWN"])
-            status_counts.update([record.status])
+            request_counts[record.method or "UNKNOWN"] += 1
+            status_counts[record.status] += 1
             # Normalise to minute precision for the global sparkline chart so
             # the GUI can render smooth sparklines without jitter.
-            minute = record.timestamp.replace(second=0, microsecond=0)
+            timestamp = record.timestamp
+            minute = minutes.get(timestamp)
+            if minute is None:
+                minute = minutes[timestamp] = timestamp.replace(second=0, microsecond=0)
             timeline_counts[minute] += 1
 
     timeline_points = [
@@ -212,26 +318,53 @@ def summarize_sessions(sessions: Iterable[Session]) -> SessionStatistics:
         request_counts=dict(request_counts),
         status_distribution=dict(status_counts),
         request_timeline=timeline_points,
+        top_ips=heapq.nlargest(3, ip_counts.items(), key=operator.itemgetter(1)),
     )
 
 
+def build_global_payload(global_stats: SessionStatistics) -> Dict[str, object]:
+    """Return the JSON-serialisable global statistics block of a report."""
+
+    return {
+        "mean_session_duration_seconds": global_stats.mean_session_duration,
+        "ip_distribution": dict(global_stats.ip_distribution),
+        "request_counts": dict(global_stats.request_counts),
+        "top_ips": list(global_stats.top_ips),
+        "status_distribution": dict(global_stats.status_distribution),
+        "request_timeline": list(global_stats.request_timeline),
+    }
+
+
 def build_session_payload(
     session: Session,
     analysis: SessionAnalysis,
     global_stats: SessionStatistics,
+    *,
+    global_payload: Optional[Mapping[str, object]] = None,
+    metadata: Optional[Mapping[str, object]] = None,
 ) -> Dict[str, object]:
-    """Return a JSON-serialisable representation of a session report."""
+    """Return a JSON-serialisable representation of a session report.
 
-    duration_seconds = session.duration.total_seconds() if session.duration else 0.0
-    unique_paths = sorted({record.path for record in session.records if record.path})
-    # Collect method counts so both the CLI and GUI can render summaries.
-    method_counts = Counter(record.method or "UNKNOWN" for record in session.records)
+    ``global_payload`` lets callers reporting many sessions share one
+    :func:`build_global_payload` result instead of rebuilding it per session.
+    ``metadata`` entries (run settings such as the model) are added as-is.
+    """
 
-    top_ips = sorted(
-        global_stats.ip_distribution.items(),
-        key=lambda item: item[1],
-        reverse=True,
-    )[:3]
+    duration_seconds = session.duration.total_seconds() if session.duration else 0.0
+    # Collect paths, method counts and raw lines in one pass so both the CLI
+    # and GUI can render summaries.
+    paths: set[str] = set()
+    method_counts: Counter[str] = Counter()
+    raw_logs: list[str] = []
+    for record in session.records:
+        if record.path:
+            paths.add(record.path)
+        method_counts[record.method or "UNKNOWN"] += 1
+        raw_logs.append(record.raw)
+    unique_paths = sorted(paths)
+
+    if global_payload is None:
+        global_payload = build_global_payload(global_stats)
 
     return {
         "session_id": session.session_id,
@@ -240,7 +373,7 @@ def build_session_payload(
         "anomaly_score": analysis.anomaly_score,
         "analyst_note": analysis.analyst_note,
         "evidence": analysis.evidence,
-        "raw_logs": [record.raw for record in session.records],
+        "raw_logs": raw_logs,
         "session_stats": {
             "duration_seconds": duration_seconds,
             "request_count": len(session.records),
@@ -248,14 +381,7 @@ def build_session_payload(
             "unique_paths": unique_paths,
             "method_counts": dict(method_counts),
         },
-        "global_stats": {
-            "mean_session_duration_seconds": global_stats.mean_session_duration,
-            "ip_distribution": dict(global_stats.ip_distribution),
-            "request_counts": dict(global_stats.request_counts),
-            "top_ips": top_ips,
-            "status_distribution": dict(global_stats.status_distribution),
-            "request_timeline": list(global_stats.request_timeline),
-        },
+        "global_stats": global_payload,
         "records": [
             {
                 "timestamp": record.timestamp.isoformat(),
@@ -268,6 +394,7 @@ def build_session_payload(
             }
             for record in session.records
         ],
+        **(metadata or {}),
     }
 
 
@@ -297,13 +424,19 @@ def _normalise_evidence(evidence: object) -> list[str]:
     return [str(evidence)]
 
 
+def _ranked(counts: Mapping[str, int]) -> list[tuple[str, int]]:
+    """Return ``counts`` items by descending count, like ``most_common()``."""
+
+    return sorted(counts.items(), key=operator.itemgetter(1), reverse=True)
+
+
 def _render_text_from_payload(payload: Dict[str, object]) -> str:
     session_stats = payload["session_stats"]
     global_stats = payload["global_stats"]
 
-    method_counts = session_stats["method_counts"]
+    method_counts = _ranked(session_stats["method_counts"])
     method_summary = ", ".join(
-        f"{method} ({count})" for method, count in Counter(method_counts).most_common()
+        f"{method} ({count})" for method, count in method_counts
     ) or "None"
 
     ip_summary = ", ".join(
@@ -346,9 +479,9 @@ def _render_markdown_from_payload(payload: Dict[str, object]) -> str:
     session_stats = payload["session_stats"]
     global_stats = payload["global_stats"]
 
-    method_counts = Counter(session_stats["method_counts"])
     method_lines = [
-        f"        - **{method}**: {count}" for method, count in method_counts.most_common()
+        f"        - **{method}**: {count}"
+        for method, count in _ranked(session_stats["method_counts"])
     ] or ["        - None"]
 
     ip_lines = [
@@ -400,10 +533,18 @@ def format_session_report(
     session: Session,
     analysis: SessionAnalysis,
     global_stats: SessionStatistics,
+    *,
+    global_payload: Optional[Mapping[str, object]] = None,
+    payload: Optional[Mapping[str, object]] = None,
 ) -> str:
-    """Combine structured data and AI notes into a rich session report."""
+    """Combine structured data and AI notes into a rich session report.
 
-    payload = build_session_payload(session, analysis, global_stats)
+    Pass ``payload`` when the :func:`build_session_payload` result for this
+    session is already at hand to render it without building it again.
+    """
+
+    if payload is None:
+        payload = build_session_payload(session, analysis, global_stats, global_payload=global_payload)
     return _render_text_from_payload(payload)
 
 
@@ -411,10 +552,18 @@ def format_session_markdown(
     session: Session,
     analysis: SessionAnalysis,
     global_stats: SessionStatistics,
+    *,
+    global_payload: Optional[Mapping[str, object]] = None,
+    payload: Optional[Mapping[str, object]] = None,
 ) -> str:
-    """Return a Markdown representation of a session report."""
+    """Return a Markdown representation of a session report.
+
+    Pass ``payload`` when the :func:`build_session_payload` result for this
+    session is already at hand to render it without building it again.
+    """
 
-    payload = build_session_payload(session, analysis, global_stats)
+    if payload is None:
+        payload = build_session_payload(session, analysis, global_stats, global_payload=global_payload)
     return _render_markdown_from_payload(payload)
 
 
@@ -422,4 +571,5 @@ def build_session_chunk(session: Session, chunk_size: int) -> str:
     """Return at most ``chunk_size`` raw log lines from ``session``."""
 
     size = max(1, chunk_size)
-    return "\n".join(record.raw for record in session.records[:size])
+    # ``str.join`` materialises its argument anyway; a list skips the generator.
+    return "\n".join([record.raw for record in session.records[:size]])
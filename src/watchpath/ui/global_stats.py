@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, List, Mapping, Tuple
 
 from PySide6.QtCharts import QBarCategoryAxis, QBarSeries, QBarSet, QChart, QChartView, QValueAxis
 from PySide6.QtCore import Qt, Signal
@@ -32,7 +32,14 @@ class GlobalStatsWidget(QFrame):
         super().__init__()
         self.setObjectName("GlobalStats")
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self._stats: Dict[str, object] = {}
+        self._stats: Mapping[str, object] = {}
+        # Chart inputs derived once per ``update_stats`` so mode switches and
+        # bar clicks only read them.
+        self._method_categories: List[str] = []
+        self._method_values: List[int] = []
+        self._status_codes: List[int] = []
+        self._status_values: List[int] = []
+        self._total_requests = 0
         self._active_mode = "Overview"
 
         layout = QVBoxLayout(self)
@@ -117,14 +124,26 @@ class GlobalStatsWidget(QFrame):
     # ╭──────────────────────────────────────────────────────────╮
     # │ Data refresh                                               │
     # ╰──────────────────────────────────────────────────────────╯
-    def update_stats(self, stats: Dict[str, object]) -> None:
+    def update_stats(self, stats: Mapping[str, object]) -> None:
         """Refresh the charts with ``stats``."""
 
         self._stats = stats or {}
+        self._derive_chart_data()
         # Repaint high-level counters before animating the heavier charts.
         self._refresh_metrics()
         self._render_summary()
 
+    def _derive_chart_data(self) -> None:
+        request_counts: Mapping[str, int] = self._stats.get("request_counts") or {}
+        # Sort alphabetically for stability.
+        self._method_categories = sorted(request_counts)
+        self._method_values = [request_counts[method] for method in self._method_categories]
+        self._total_requests = sum(self._method_values)
+
+        status_distribution: Mapping[int, int] = self._stats.get("status_distribution") or {}
+        self._status_codes = sorted(status_distribution)
+        self._status_values = [status_distribution[code] for code in self._status_codes]
+
     # ╭──────────────────────────────────────────────────────────╮
     # │ Mode switching                                            │
     # ╰──────────────────────────────────────────────────────────╯
@@ -155,7 +174,7 @@ class GlobalStatsWidget(QFrame):
             self.footer.setText(f"{mode} metrics are loading…")
             return
 
-        error_message = self._stats.get("error") if isinstance(self._stats, dict) else None
+        error_message = self._stats.get("error") if isinstance(self._stats, Mapping) else None
         if error_message:
             self._show_placeholder(f"⚠️ Unable to load analytics. {error_message}")
             self.footer.setText("Retry after resolving the data source issue.")
@@ -171,15 +190,11 @@ class GlobalStatsWidget(QFrame):
         chart.setAnimationOptions(QChart.SeriesAnimations)
         chart.legend().setVisible(False)
 
-        request_counts: Dict[str, int] = dict(
-            self._stats.get("request_counts", {}) or {}
-        )
+        categories = self._method_categories
+        values = self._method_values
         series = QBarSeries()
         total_requests = 0
-        if request_counts:
-            # Sort alphabetically for stability.
-            categories = sorted(request_counts)
-            values = [request_counts[method] for method in categories]
+        if categories:
             bar_set = QBarSet("Requests")
             bar_set.append(values)
             bar_set.clicked.connect(self._emit_method_activation)  # type: ignore[attr-defined]
@@ -203,7 +218,7 @@ class GlobalStatsWidget(QFrame):
             axis_y.applyNiceNumbers()
             chart.addAxis(axis_y, Qt.AlignLeft)
             series.attachAxis(axis_y)
-            total_requests = sum(values)
+            total_requests = self._total_requests
         else:
             self._show_placeholder("No request data available yet")
 
@@ -215,7 +230,7 @@ class GlobalStatsWidget(QFrame):
             f"Total requests: {total_requests} • Frequent IPs: {top_summary}"
         )
 
-        if request_counts:
+        if categories:
             self._display_chart(chart)
 
     def _render_status_distribution(self) -> None:
@@ -224,14 +239,11 @@ class GlobalStatsWidget(QFrame):
         chart.legend().setVisible(False)
         chart.setAnimationOptions(QChart.SeriesAnimations)
 
-        status_distribution: Dict[int, int] = dict(
-            self._stats.get("status_distribution", {}) or {}
-        )
+        ordered_codes = self._status_codes
+        values = self._status_values
         series = QBarSeries()
-        if status_distribution:
-            ordered_codes = sorted(status_distribution)
+        if ordered_codes:
             categories = [str(code) for code in ordered_codes]
-            values = [status_distribution[code] for code in ordered_codes]
             bar_set = QBarSet("Responses")
             bar_set.append(values)
             series.append(bar_set)
@@ -253,13 +265,13 @@ class GlobalStatsWidget(QFrame):
             series.attachAxis(axis_y)
             self.footer.setText(
                 "Status mix: "
-                + ", ".join(f"{code}: {count}" for code, count in sorted(status_distribution.items()))
+                + ", ".join(f"{code}: {count}" for code, count in zip(ordered_codes, values))
             )
         else:
             chart.setTitle("No status codes observed yet")
             self.footer.setText("Status code data will appear after analysing sessions.")
 
-        if not status_distribution:
+        if not ordered_codes:
             self._show_placeholder("No status codes observed yet")
         else:
             bar_set.clicked.connect(self._emit_status_activation)  # type: ignore[attr-defined]
@@ -291,11 +303,7 @@ class GlobalStatsWidget(QFrame):
         return tile, metric_value
 
     def _refresh_metrics(self) -> None:
-        total_requests = 0
-        request_counts: Dict[str, int] = dict(self._stats.get("request_counts", {}) or {})
-        if request_counts:
-            total_requests = sum(request_counts.values())
-
+        total_requests = self._total_requests
         mean_duration = self._stats.get("mean_session_duration_seconds") or 0.0
         top_ips = self._stats.get("top_ips") or []
 
@@ -317,18 +325,12 @@ class GlobalStatsWidget(QFrame):
         self.chart_stack.setCurrentWidget(self.chart_placeholder)
 
     def _emit_status_activation(self, index: int) -> None:
-        status_distribution: Dict[int, int] = dict(
-            self._stats.get("status_distribution", {}) or {}
-        )
-        ordered_codes = sorted(status_distribution)
+        ordered_codes = self._status_codes
         if 0 <= index < len(ordered_codes):
             self.dataPointActivated.emit(str(ordered_codes[index]))
 
     def _emit_method_activation(self, index: int) -> None:
-        request_counts: Dict[str, int] = dict(
-            self._stats.get("request_counts", {}) or {}
-        )
-        categories = sorted(request_counts)
+        categories = self._method_categories
         if 0 <= index < len(categories):
             self.dataPointActivated.emit(categories[index])
 
@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QFileSystemWatcher, QObject, QSignalBlocker, Qt, QThreadPool, Signal
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -37,6 +37,48 @@ class PromptEntry:
     modified: datetime
 
 
+def _scan_prompts(root: Path) -> Optional[tuple[list[PromptEntry], set[Path]]]:
+    """Collect templates under ``root`` and the folders holding them."""
+
+    if not root.exists():
+        return None
+    entries: list[PromptEntry] = []
+    directories = {root}
+    for path in sorted(root.glob("**/*.txt")):
+        directories.add(path.parent)
+        modified = datetime.fromtimestamp(path.stat().st_mtime)
+        relative_folder = path.parent.relative_to(root)
+        folder_terms = "" if relative_folder == Path(".") else relative_folder.as_posix()
+        folder_display = folder_terms if folder_terms else "(root)"
+        entries.append(
+            PromptEntry(
+                path=path,
+                title=path.stem,
+                folder_display=folder_display,
+                folder_terms=folder_terms,
+                modified=modified,
+            )
+        )
+    return entries, directories
+
+
+class _PromptScan(QObject):
+    """Run :func:`_scan_prompts` off the GUI thread."""
+
+    finished = Signal(object)
+
+    def __init__(self, root: Path) -> None:
+        super().__init__()
+        self.root = root
+
+    def run(self) -> None:  # pragma: no cover - executed on a pool thread
+        try:
+            result = _scan_prompts(self.root)
+        except OSError:
+            result = None
+        self.finished.emit(result)
+
+
 class PromptManagerPanel(QWidget):
     """Browse prompt templates, preview contents, and manage overrides."""
 
@@ -94,31 +136,69 @@ class PromptManagerPanel(QWidget):
         layout.addLayout(controls)
 
         self._prompt_entries: list[PromptEntry] = []
-        self.reload()
+        # Directory and template watches mark the list stale so reopening the
+        # manager only rescans the disk when something actually changed;
+        # in-place edits only show up through the per-file watches.
+        self._prompts_dirty = True
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._mark_dirty)
+        self._watcher.fileChanged.connect(self._mark_dirty)
+        self._scan: Optional[_PromptScan] = None
+        self.reload_async()
 
     # ------------------------------------------------------------------
     def set_prompt_root(self, root: Path) -> None:
         self._prompt_root = root
         self.reload()
 
+    def reload_if_changed(self) -> None:
+        if self._prompts_dirty:
+            self.reload_async()
+
+    def reload_async(self) -> None:
+        """Rescan templates on the thread pool and fill the list when done."""
+
+        # Cleared up front so a change seen mid-scan queues another rescan.
+        self._prompts_dirty = False
+        scan = _PromptScan(self._prompt_root)
+        scan.finished.connect(self._on_scan_finished)
+        self._scan = scan
+        QThreadPool.globalInstance().start(scan.run)
+
+    def _on_scan_finished(self, result: object) -> None:
+        if self.sender() is not self._scan:
+            return
+        self._scan = None
+        self._apply_scan(result)
+
+    def _mark_dirty(self, _path: str = "") -> None:
+        self._prompts_dirty = True
+
+    def _watch_paths(self, paths: set[Path]) -> None:
+        wanted = {str(path) for path in paths}
+        watched = set(self._watcher.directories()) | set(self._watcher.files())
+        stale = watched - wanted
+        if stale:
+            self._watcher.removePaths(sorted(stale))
+        missing = wanted - watched
+        if missing:
+            self._watcher.addPaths(sorted(missing))
+
     def reload(self) -> None:
-        self._prompt_entries = []
-        self.prompt_list.clear()
-        if not self._prompt_root.exists():
+        self._prompts_dirty = False
+        self._scan = None
+        self._apply_scan(_scan_prompts(self._prompt_root))
+
+    def _apply_scan(self, result: Optional[tuple[list[PromptEntry], set[Path]]]) -> None:
+        if result is None:
+            # Nothing to watch yet; keep rescanning until the folder appears.
+            self._prompt_entries = []
+            self.prompt_list.clear()
+            self._watch_paths(set())
+            self._prompts_dirty = True
             return
-        for path in sorted(self._prompt_root.glob("**/*.txt")):
-            modified = datetime.fromtimestamp(path.stat().st_mtime)
-            relative_folder = path.parent.relative_to(self._prompt_root)
-            folder_terms = "" if relative_folder == Path(".") else relative_folder.as_posix()
-            folder_display = folder_terms if folder_terms else "(root)"
-            entry = PromptEntry(
-                path=path,
-                title=path.stem,
-                folder_display=folder_display,
-                folder_terms=folder_terms,
-                modified=modified,
-            )
-            self._prompt_entries.append(entry)
+        self._prompt_entries, directories = result
+        self._watch_paths(directories | {entry.path for entry in self._prompt_entries})
         self._populate_prompt_list(self.search_input.text())
 
     def _on_prompt_selected(self, current: QListWidgetItem, previous: QListWidgetItem) -> None:
@@ -139,26 +219,24 @@ class PromptManagerPanel(QWidget):
         if current_item:
             current_path = current_item.data(Qt.UserRole)
 
-        self.prompt_list.blockSignals(True)
-        self.prompt_list.clear()
-
-        normalized = filter_text.strip().lower()
-        to_select: Optional[QListWidgetItem] = None
-
-        for entry in self._prompt_entries:
-            haystack = f"{entry.title} {entry.folder_display} {entry.folder_terms}".lower()
-            if normalized and normalized not in haystack:
-                continue
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, entry.path)
-            widget = PromptListItemWidget(entry)
-            item.setSizeHint(widget.sizeHint())
-            self.prompt_list.addItem(item)
-            self.prompt_list.setItemWidget(item, widget)
-            if current_path and entry.path == current_path:
-                to_select = item
-
-        self.prompt_list.blockSignals(False)
+        with QSignalBlocker(self.prompt_list):
+            self.prompt_list.clear()
+
+            normalized = filter_text.strip().lower()
+            to_select: Optional[QListWidgetItem] = None
+
+            for entry in self._prompt_entries:
+                haystack = f"{entry.title} {entry.folder_display} {entry.folder_terms}".lower()
+                if normalized and normalized not in haystack:
+                    continue
+                item = QListWidgetItem()
+                item.setData(Qt.UserRole, entry.path)
+                widget = PromptListItemWidget(entry)
+                item.setSizeHint(widget.sizeHint())
+                self.prompt_list.addItem(item)
+                self.prompt_list.setItemWidget(item, widget)
+                if current_path and entry.path == current_path:
+                    to_select = item
 
         if to_select is not None:
             self.prompt_list.setCurrentItem(to_select)
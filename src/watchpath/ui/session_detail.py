@@ -17,7 +17,7 @@ from PySide6.QtWidgets import (
     QGraphicsDropShadowEffect,
 )
 
-from .severity import coerce_score, severity_for_score
+from .severity import SeverityStyle, coerce_score, severity_for_score
 
 # ╭──────────────────────────────────────────────────────────────╮
 # │ Session spotlight widget with kaomoji reactions.             │
@@ -30,6 +30,9 @@ class SessionDetailWidget(QWidget):
     def __init__(self) -> None:
         super().__init__()
         self._current_session: Optional[Any] = None
+        # The Markdown tab is rendered only once it is shown for a session.
+        self._markdown_stale = False
+        self._applied_severity: Optional[SeverityStyle] = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -142,6 +145,7 @@ class SessionDetailWidget(QWidget):
         self.tabs.addTab(self.evidence_view, "Evidence")
         self.tabs.addTab(self.logs_view, "Logs")
         self.tabs.addTab(self.markdown_view, "Markdown")
+        self.tabs.currentChanged.connect(self._render_markdown_if_visible)
 
         layout.addWidget(self.tabs, 1)
 
@@ -152,6 +156,7 @@ class SessionDetailWidget(QWidget):
     # ╰──────────────────────────────────────────────────────────╯
     def clear(self) -> None:
         self._current_session = None
+        self._markdown_stale = False
         self.session_label.setText("Select a session to begin the journey ✨")
         self.metadata_label.setText("—")
         base_style = severity_for_score(None)
@@ -218,13 +223,27 @@ class SessionDetailWidget(QWidget):
         self.evidence_view.setPlainText(self._render_evidence_text(evidence))
         raw_logs = "\n".join(payload.get("raw_logs", []))
         self.logs_view.setPlainText(raw_logs)
-        self.markdown_view.setMarkdown(getattr(processed, "markdown_report", ""))
+        # Building and laying out the Markdown report is the costliest part
+        # of a switch; skip it until the tab is actually looked at.
+        self._markdown_stale = True
+        self._render_markdown_if_visible()
+
+    def _render_markdown_if_visible(self, _index: int = -1) -> None:
+        if not self._markdown_stale or self.tabs.currentWidget() is not self.markdown_view:
+            return
+        self._markdown_stale = False
+        self.markdown_view.setMarkdown(getattr(self._current_session, "markdown_report", ""))
 
     # ╭──────────────────────────────────────────────────────────╮
     # │ Visual theming                                            │
     # ╰──────────────────────────────────────────────────────────╯
     def _apply_severity_style(self, score: Optional[float]) -> None:
         style = severity_for_score(score)
+        # Severity styles are module-level singletons, so an identity check is
+        # enough to skip re-parsing identical stylesheets between sessions.
+        if style is self._applied_severity:
+            return
+        self._applied_severity = style
         self.kaomoji_label.setText(style.kaomoji)
         self.kaomoji_label.setStyleSheet(f"color: {style.color};")
         if self._kaomoji_shadow is not None:
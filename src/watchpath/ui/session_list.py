@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from PySide6.QtCore import (
     QAbstractListModel,
     QModelIndex,
     QSettings,
+    QSignalBlocker,
     QSize,
     Qt,
     QRect,
@@ -69,10 +70,18 @@ class SessionListWidget(QWidget):
     def __init__(self) -> None:
         super().__init__()
         self._entries: List[SessionListEntry] = []
+        # session_id -> position in ``_entries`` for constant-time lookups.
+        self._entry_positions: Dict[str, int] = {}
         self._filtered_entries: List[SessionListEntry] = []
+        # Values already offered by the method/IP combos, so adding a session
+        # doesn't rescan the combo items.
+        self._method_values: set = set()
+        self._ip_values: set = set()
         self._pending_method_value: Optional[str] = None
         self._pending_ip_value: Optional[str] = None
         self._restoring_state = False
+        self._saved_filter_state: Optional[tuple] = None
+        self._filters_dirty = False
         self._settings = QSettings("Watchpath", "SessionListWidget")
         self._shortcuts: List[QShortcut] = []
 
@@ -166,6 +175,76 @@ class SessionListWidget(QWidget):
 
     # ------------------------------------------------------------------
     def add_session(self, processed: Any) -> None:
+        self.add_sessions([processed])
+
+    def add_sessions(self, sessions: Iterable[Any]) -> None:
+        """Append sessions, inserting only their rows into the visible list."""
+
+        shown = self._filtered_entries
+        added: List[SessionListEntry] = []
+        for processed in sessions:
+            entry = self._make_entry(processed)
+            self._entry_positions.setdefault(entry.session_id, len(self._entries))
+            self._entries.append(entry)
+            self._update_filters(entry)
+            added.append(entry)
+        if not added or self._filtered_entries is not shown:
+            # Nothing new, or a restored filter value already re-ran the pass.
+            return
+        # An empty or stale view needs the full pass (placeholder text and
+        # default selection); otherwise matching rows are appended in place,
+        # leaving the current selection alone.
+        if not self._filtered_entries or not self.isVisible():
+            self._apply_filters()
+            return
+        passes = self._filter_predicate()
+        matching = [entry for entry in added if passes(entry)]
+        if matching:
+            self._filtered_entries.extend(matching)
+            self._list_model.append_entries(matching)
+
+    def replace_sessions(self, replacements: Mapping[str, Any]) -> bool:
+        """Swap updated results into their existing rows.
+
+        Rows are updated in place unless a replacement changes which sessions
+        pass the active filters. Returns ``False`` if any session id is unknown.
+        """
+
+        passes = self._filter_predicate()
+        found = 0
+        membership_changed = False
+        updated_entries: List[SessionListEntry] = []
+        for session_id, processed in replacements.items():
+            position = self._entry_positions.get(session_id)
+            if position is None:
+                continue
+            entry = self._entries[position]
+            updated = self._make_entry(processed)
+            self._entries[position] = updated
+            self._update_filters(updated)
+            found += 1
+            if passes(entry) != passes(updated):
+                membership_changed = True
+            updated_entries.append(updated)
+
+        if membership_changed or not self.isVisible():
+            self._apply_filters()
+        else:
+            for updated in updated_entries:
+                row = self._list_model.row_for_session(updated.session_id)
+                if row is not None:
+                    self._filtered_entries[row] = updated
+                    self._list_model.replace_entry(row, updated)
+            self._on_selection_changed(None, None)
+        return found == len(replacements)
+
+    def find_session(self, session_id: str) -> Any:
+        """Return the processed session for ``session_id``, or ``None``."""
+
+        position = self._entry_positions.get(session_id)
+        return None if position is None else self._entries[position].processed
+
+    def _make_entry(self, processed: Any) -> SessionListEntry:
         payload = getattr(processed, "payload", processed)
         session_id = payload.get("session_id", "unknown")
         ip = payload.get("ip", "-")
@@ -174,7 +253,7 @@ class SessionListWidget(QWidget):
         score_value = coerce_score(raw_score)
         score_available = score_value is not None
         score = score_value if score_value is not None else 0.0
-        entry = SessionListEntry(
+        return SessionListEntry(
             processed=processed,
             session_id=session_id,
             ip=ip,
@@ -183,22 +262,22 @@ class SessionListWidget(QWidget):
             score_available=score_available,
             payload=payload,
         )
-        self._entries.append(entry)
-        self._update_filters(entry)
-        self._apply_filters()
 
     def clear(self) -> None:
         self._entries.clear()
-        self.method_filter.clear()
-        self.method_filter.addItem("All methods", None)
-        self.ip_filter.clear()
-        self.ip_filter.addItem("All IPs", None)
+        self._entry_positions.clear()
+        # Emptying the combos would otherwise re-run the filters twice.
+        with QSignalBlocker(self.method_filter), QSignalBlocker(self.ip_filter):
+            self._reset_filter_options()
         self._filtered_entries.clear()
         self._list_model.set_entries([])
         self.list_widget.selectionModel().clearSelection()
         self._save_settings()
         self._update_bulk_actions()
 
+    def session_count(self) -> int:
+        return len(self._entries)
+
     def selected_payloads(self) -> List[Dict[str, Any]]:
         payloads: List[Dict[str, Any]] = []
         if not self.list_widget.selectionModel():
@@ -227,19 +306,27 @@ class SessionListWidget(QWidget):
         self.score_filter.setCurrentIndex(0)
         self._save_settings()
 
-    def _update_filters(self, entry: SessionListEntry) -> None:
-        def _ensure(combo: QComboBox, value: str, label_prefix: str) -> None:
-            for index in range(combo.count()):
-                if combo.itemData(index) == value:
-                    return
-            combo.addItem(f"{label_prefix}: {value}", value)
+    def _reset_filter_options(self) -> None:
+        self.method_filter.clear()
+        self.method_filter.addItem("All methods", None)
+        self._method_values.clear()
+        self.ip_filter.clear()
+        self.ip_filter.addItem("All IPs", None)
+        self._ip_values.clear()
 
+    def _update_filters(self, entry: SessionListEntry) -> None:
+        added = False
         for method in entry.methods:
-            if method:
-                _ensure(self.method_filter, method, "Method")
-        if entry.ip:
-            _ensure(self.ip_filter, entry.ip, "IP")
-        self._apply_pending_filter_values()
+            if method and method not in self._method_values:
+                self._method_values.add(method)
+                self.method_filter.addItem(f"Method: {method}", method)
+                added = True
+        if entry.ip and entry.ip not in self._ip_values:
+            self._ip_values.add(entry.ip)
+            self.ip_filter.addItem(f"IP: {entry.ip}", entry.ip)
+            added = True
+        if added:
+            self._apply_pending_filter_values()
 
     def _passes_score_filter(self, entry: SessionListEntry) -> bool:
         index = self.score_filter.currentIndex()
@@ -259,22 +346,36 @@ class SessionListWidget(QWidget):
     # ╭──────────────────────────────────────────────────────────╮
     # │ Filtering + persistence                                   │
     # ╰──────────────────────────────────────────────────────────╯
-    def _apply_filters(self) -> None:
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._filters_dirty:
+            self._apply_filters()
+
+    def _filter_predicate(self) -> Callable[[SessionListEntry], bool]:
         query = self.search_box.text().strip().lower()
         method_value = self.method_filter.currentData()
         ip_value = self.ip_filter.currentData()
 
-        self._filtered_entries = []
-        for entry in self._entries:
+        def passes(entry: SessionListEntry) -> bool:
             if query and query not in entry.session_id.lower():
-                continue
+                return False
             if method_value and method_value not in entry.methods:
-                continue
+                return False
             if ip_value and entry.ip != ip_value:
-                continue
-            if not self._passes_score_filter(entry):
-                continue
-            self._filtered_entries.append(entry)
+                return False
+            return self._passes_score_filter(entry)
+
+        return passes
+
+    def _apply_filters(self) -> None:
+        # While hidden, sessions streaming in only mark the view stale; the
+        # filter pass and model reset run once when the carousel is shown.
+        if not self.isVisible():
+            self._filters_dirty = True
+            return
+        self._filters_dirty = False
+        passes = self._filter_predicate()
+        self._filtered_entries = [entry for entry in self._entries if passes(entry)]
 
         if self._filtered_entries:
             self._list_model.set_entries(self._filtered_entries)
@@ -361,26 +462,32 @@ class SessionListWidget(QWidget):
                 self._pending_ip_value = None
 
     def _find_combo_index(self, combo: QComboBox, value: str) -> int:
-        for idx in range(combo.count()):
-            if combo.itemData(idx) == value:
-                return idx
-        return -1
+        return combo.findData(value)
 
     def _save_settings(self) -> None:
         if self._restoring_state:
             return
-        self._settings.setValue("filters/search", self.search_box.text())
+        search_value = self.search_box.text()
         method_value = self.method_filter.currentData()
+        ip_value = self.ip_filter.currentData()
+        score_index = self.score_filter.currentIndex()
+        # Filtering runs on every added session; only touch QSettings when
+        # the filter state actually moved since the last write.
+        state = (search_value, method_value, ip_value, score_index)
+        if state == self._saved_filter_state:
+            return
+        self._saved_filter_state = state
+
+        self._settings.setValue("filters/search", search_value)
         if method_value:
             self._settings.setValue("filters/method", method_value)
         else:
             self._settings.remove("filters/method")
-        ip_value = self.ip_filter.currentData()
         if ip_value:
             self._settings.setValue("filters/ip", ip_value)
         else:
             self._settings.remove("filters/ip")
-        self._settings.setValue("filters/score_index", self.score_filter.currentIndex())
+        self._settings.setValue("filters/score_index", score_index)
 
     def _update_bulk_actions(self) -> None:
         count = len(self.selected_sessions())
@@ -404,6 +511,7 @@ class _SessionListModel(QAbstractListModel):
     def __init__(self) -> None:
         super().__init__()
         self._entries: List[SessionListEntry] = []
+        self._rows: Dict[str, int] = {}
         self._placeholder: Optional[str] = None
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
@@ -449,14 +557,34 @@ class _SessionListModel(QAbstractListModel):
         self.beginResetModel()
         self._placeholder = None
         self._entries = list(entries)
+        self._rows = {}
+        for row, entry in enumerate(self._entries):
+            self._rows.setdefault(entry.session_id, row)
         self.endResetModel()
 
+    def append_entries(self, entries: List[SessionListEntry]) -> None:
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        for row, entry in enumerate(entries, start=first):
+            self._entries.append(entry)
+            self._rows.setdefault(entry.session_id, row)
+        self.endInsertRows()
+
+    def replace_entry(self, row: int, entry: SessionListEntry) -> None:
+        self._entries[row] = entry
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
     def set_placeholder(self, message: str) -> None:
         self.beginResetModel()
         self._entries = []
+        self._rows = {}
         self._placeholder = message
         self.endResetModel()
 
+    def row_for_session(self, session_id: str) -> Optional[int]:
+        return self._rows.get(session_id)
+
     def first_selectable_index(self) -> QModelIndex:
         if self._placeholder is not None:
             return QModelIndex()